@@ -21,7 +21,7 @@ if TYPE_CHECKING:  # pragma: no cover - import guard for type checking only
     from .cmn_database import DatabaseManager
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """アプリ全体の状態を保持するデータクラス。
 
@@ -31,21 +31,78 @@ import uuid
 import zipfile
 from collections import Counter
 from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Iterator, Optional
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Mapping, Optional
 
 from packaging.version import Version
 
 from app.function.core import backup_restore, paths, versioning
+from app.function.core.match_aliases import RESULT_ALIASES, TURN_ALIASES
 from app.function.core.youtube_types import YouTubeSyncFlag
 
 from .cmn_logger import log_error
 
+try:  # pragma: no cover - optional acceleration
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+if orjson is not None:  # pragma: no cover - depends on environment
+
+    def _json_dumps(value: object) -> str:
+        """キーワード一覧を JSON 文字列へ変換（orjson 利用）。"""
+
+        return orjson.dumps(value).decode("utf-8")
+
+    _json_loads = orjson.loads
+else:
+
+    def _json_dumps(value: object) -> str:
+        """キーワード一覧を JSON 文字列へ変換（標準 json 利用）。"""
+
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=4096)
+def _epoch_to_iso(ts: int) -> str:
+    """エポック秒を UTC の ISO 8601 文字列へ変換（同一秒の結果はキャッシュ）。"""
+
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
 
 MigrationFunc = Callable[["DatabaseManager"], None]
 MigrationStep = tuple[Version, Version, MigrationFunc]
 
+_YOUTUBE_STATUS_NAMES: Mapping[int, str] = MappingProxyType(
+    {int(flag): flag.name.lower() for flag in YouTubeSyncFlag}
+)
+_YOUTUBE_STATUS_DEFAULT = YouTubeSyncFlag.NOT_REQUESTED.name.lower()
+
+_SQL_INSERT_MATCH = """
+    INSERT INTO matches (
+        match_no,
+        deck_id,
+        season_id,
+        turn,
+        opponent_deck,
+        keywords,
+        memo,
+        result,
+        youtube_flag,
+        youtube_url,
+        youtube_video_id,
+        youtube_checked_at,
+        favorite
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 def migrate_020_to_021(db: "DatabaseManager") -> None:
     # ここは後続タスクで実装。今は pass
@@ -116,6 +173,42 @@ def migrate_032_to_041(db: "DatabaseManager") -> None:
                 )
 
 
+def migrate_041_to_042(db: "DatabaseManager") -> None:
+    """Trim legacy opponent deck names so usage counts can use an index in v0.4.2."""
+
+    with db.transaction() as connection:
+        if db._table_exists(connection, "opponent_decks"):
+            # 前後空白だけが異なる重複は TRIM 済み（なければ最古）の行へ寄せる
+            connection.execute(
+                """
+                DELETE FROM opponent_decks
+                WHERE name <> TRIM(name)
+                  AND EXISTS (
+                      SELECT 1 FROM opponent_decks AS other
+                      WHERE other.id <> opponent_decks.id
+                        AND TRIM(other.name) = TRIM(opponent_decks.name)
+                        AND (other.name = TRIM(other.name) OR other.id < opponent_decks.id)
+                  )
+                """
+            )
+            connection.execute(
+                """
+                UPDATE opponent_decks
+                SET name = TRIM(name)
+                WHERE name <> TRIM(name) AND TRIM(name) <> ''
+                """
+            )
+        if db._table_exists(connection, "matches"):
+            connection.execute(
+                """
+                UPDATE matches
+                SET opponent_deck = TRIM(opponent_deck)
+                WHERE opponent_deck <> TRIM(opponent_deck)
+                """
+            )
+    db.recalculate_usage_counts()
+
+
 def migrate_legacy_to_020(db: "DatabaseManager") -> None:
     # 旧版→0.2.0 のベースへ。構造補完は _migrate_schema 前段で済むため実処理は不要。
     pass
@@ -127,6 +220,7 @@ MIGRATION_CHAIN: list[MigrationStep] = [
     (Version("0.3.0"), Version("0.3.1"), migrate_030_to_031),
     (Version("0.3.1"), Version("0.3.2"), migrate_031_to_032),
     (Version("0.3.2"), Version("0.4.1"), migrate_032_to_041),
+    (Version("0.4.1"), Version("0.4.2"), migrate_041_to_042),
 ]
 
 
@@ -576,7 +670,11 @@ class DatabaseManager:
         return str(version)
 
     def set_schema_version(self, version: str | int | Version) -> None:
-        """スキーマバージョンを更新する。"""
+        """スキーマバージョンを更新する。
+
+        ``PRAGMA user_version`` と ``db_metadata.schema_version`` の双方が既に
+        同じ値であれば書き込みを行いません。
+        """
 
         normalized_version = versioning.coerce_version(
             version, fallback=versioning.get_target_version()
@@ -585,6 +683,16 @@ class DatabaseManager:
         normalized = str(normalized_version)
 
         with self._connect() as connection:
+            # 読み取りだけで判定し、起動毎の書き込みトランザクションを避ける
+            row = connection.execute(
+                "SELECT value FROM db_metadata WHERE key = 'schema_version'"
+            ).fetchone()
+            if (
+                self._get_user_version(connection) == target_version
+                and row is not None
+                and row["value"] == normalized
+            ):
+                return
             connection.execute("BEGIN")
             try:
                 self._set_user_version(connection, target_version)
@@ -765,6 +873,9 @@ class DatabaseManager:
                     keyword_changed = True
 
             if self._table_exists(connection, "matches"):
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_matches_opponent_deck ON matches(opponent_deck)"
+                )
                 if not self._column_exists(connection, "matches", "season_id"):
                     connection.execute(
                         "ALTER TABLE matches ADD COLUMN season_id INTEGER"
@@ -915,8 +1026,8 @@ class DatabaseManager:
                 with file_path.open("w", encoding="utf-8", newline="") as stream:
                     writer = csv.writer(stream)
                     writer.writerow(columns)
-                    for row in cursor.fetchall():
-                        writer.writerow([row[col] for col in columns])
+                    # sqlite3.Row は列順に値を返すため、カーソルをそのまま流し込む
+                    writer.writerows(cursor)
 
         return destination
 
@@ -1007,6 +1118,68 @@ class DatabaseManager:
 
         return report
 
+    def export_snapshot(self, destination: Optional[Path | str] = None) -> Path:
+        """SQLite のオンラインバックアップ API で DB ファイルの複製を作成する。
+
+        入力
+            destination: ``Optional[Path | str]``
+                出力先ファイルパス。省略時は ``backups/<timestamp>.sqlite3``。
+        出力
+            ``Path``
+                作成したスナップショットファイルのパス。
+        処理概要
+            1. 出力先ファイルへ新規コネクションを開きます。
+            2. ``Connection.backup`` でページ単位に複製し、スキーマ・インデックスを
+               そのまま保持します（CSV 形式の :meth:`export_backup` は互換用に継続）。
+        """
+
+        if destination is None:
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            destination = paths.backup_dir() / f"{timestamp}.sqlite3"
+        else:
+            destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        source_conn = self._connect()
+        target_conn = sqlite3.connect(destination)
+        try:
+            source_conn.backup(target_conn, pages=1000)
+        except sqlite3.DatabaseError as exc:
+            log_error("Failed to export snapshot", exc, destination=str(destination))
+            raise DatabaseError("Failed to export snapshot") from exc
+        finally:
+            target_conn.close()
+            source_conn.close()
+        return destination
+
+    def import_snapshot(self, source: Path | str) -> None:
+        """:meth:`export_snapshot` で作成したファイルから DB 全体を復元する。
+
+        入力
+            source: ``Path | str``
+                復元元となる SQLite ファイル。
+        出力
+            ``None``
+        処理概要
+            1. 復元元ファイルの存在を確認します。
+            2. ``Connection.backup`` で現在の DB へページを上書きコピーします。
+        """
+
+        source_path = Path(source)
+        if not source_path.exists():
+            raise DatabaseError(f"Snapshot '{source}' not found")
+
+        source_conn = sqlite3.connect(source_path)
+        target_conn = self._connect()
+        try:
+            source_conn.backup(target_conn, pages=1000)
+        except sqlite3.DatabaseError as exc:
+            log_error("Failed to import snapshot", exc, source=str(source_path))
+            raise DatabaseError("Failed to import snapshot") from exc
+        finally:
+            target_conn.close()
+            source_conn.close()
+
     def reset_database(self) -> None:
         """テーブルを再構築して空の状態へ初期化する。"""
 
@@ -1049,11 +1222,7 @@ class DatabaseManager:
             results: list[dict[str, object]] = []
             for row in cursor.fetchall():
                 payload = dict(row)
-                payload.setdefault("notes", payload.get("description", ""))
-                payload.pop("description", None)
-                payload["rank_statistics_target"] = bool(
-                    payload.get("rank_statistics_target", 0)
-                )
+                payload["rank_statistics_target"] = bool(payload["rank_statistics_target"])
                 results.append(payload)
             return results
 
@@ -1093,10 +1262,8 @@ class DatabaseManager:
 
                 cursor = connection.execute(query, params)
                 rows = cursor.fetchall()
-                return [
-                    self._hydrate_match_row(row, keyword_lookup, name_lookup)
-                    for row in rows
-                ]
+                hydrate = self._hydrate_match_row
+                return [hydrate(row, keyword_lookup, name_lookup) for row in rows]
 
         try:
             return _run_query()
@@ -1168,11 +1335,24 @@ class DatabaseManager:
 
         直近の `match_no` を見て +1 した値を返します。DB が空の場合は 1。
         数値化に失敗した場合も安全側で 1 を返すフォールバックを実装しています。
+        キーワード復元が不要なため `match_no` のみをタプル行で取得します。
         """
-        last_match = self.fetch_last_match(deck_name)
-        if last_match is None:
+        query = "SELECT match_no FROM matches"
+        with self._connect() as connection:
+            params: tuple[object, ...] = ()
+            if deck_name:
+                deck_id = self._find_deck_id(connection, deck_name)
+                if deck_id is None:
+                    return 1
+                query += " WHERE deck_id = ?"
+                params = (deck_id,)
+            query += " ORDER BY created_at DESC, id DESC LIMIT 1"
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            row = cursor.execute(query, params).fetchone()
+        if row is None:
             return 1
-        last_no = last_match.get("match_no")
+        last_no = row[0]
         try:
             return int(last_no) + 1
         except (TypeError, ValueError):
@@ -1211,8 +1391,8 @@ class DatabaseManager:
         start_time: str | None = None,
         end_date: str | None = None,
         end_time: str | None = None,
-    ) -> None:
-        """シーズン定義を追加。重複時は `DuplicateEntryError`。"""
+    ) -> int:
+        """シーズン定義を追加し採番された ID を返却。重複時は `DuplicateEntryError`。"""
 
         def _normalize_flag(value: object) -> int:
             if isinstance(value, str):
@@ -1228,7 +1408,7 @@ class DatabaseManager:
         flag_value = _normalize_flag(rank_statistics_target)
         try:
             with self._connect() as connection:
-                connection.execute(
+                cursor = connection.execute(
                     """
                     INSERT INTO seasons (
                         name,
@@ -1251,6 +1431,7 @@ class DatabaseManager:
                         flag_value,
                     ),
                 )
+                return int(cursor.lastrowid)
         except sqlite3.IntegrityError as exc:  # pragma: no cover - defensive
             log_error("Duplicate season insertion attempted", exc, name=name)
             raise DuplicateEntryError(f"Season '{name}' already exists") from exc
@@ -1289,13 +1470,113 @@ class DatabaseManager:
             log_error("Failed to delete season", exc, name=name)
             raise DatabaseError("Failed to delete season") from exc
 
-    def record_match(self, record: dict[str, object]) -> None:
-        """対戦ログを 1 件保存します。
+    def record_match(self, record: dict[str, object]) -> int:
+        """対戦ログを 1 件保存し、採番された ID を返します。
 
         必須キー: ``match_no``, ``deck_name``, ``turn``, ``result``
         任意キー: ``opponent_deck``, ``keywords``（イテラブル可）
         ``keywords`` は JSON 文字列へシリアライズして保存します。
         """
+        _, last_id = self._insert_matches([record])
+        return last_id
+
+    def record_matches(self, records: Iterable[dict[str, object]]) -> int:
+        """複数の対戦ログを 1 トランザクションでまとめて保存します。
+
+        入力
+            records: ``Iterable[dict[str, object]]``
+                :meth:`record_match` と同じ形式の対戦ログ辞書の集合。
+        出力
+            ``int``
+                保存した対戦ログの件数。
+        処理概要
+            1. キーワードのルックアップを 1 度だけ構築し、各レコードを検証・正規化。
+            2. ``executemany`` で ``matches`` へ一括 INSERT。
+            3. デッキ・対戦相手・キーワードの使用回数を集計し、まとめて加算します。
+            いずれかのレコードが不正な場合は全件ロールバックします。
+        """
+        count, _ = self._insert_matches(records)
+        return count
+
+    def _insert_matches(
+        self, records: Iterable[dict[str, object]]
+    ) -> tuple[int, int]:
+        """対戦ログを一括保存し、(件数, 最後に採番された ID) を返します。"""
+
+        params: list[tuple[object, ...]] = []
+        try:
+            with self._connect() as connection:
+                keyword_lookup, name_lookup = self._build_keyword_lookups(connection)
+                deck_counts: Counter[int] = Counter()
+                opponent_counts: Counter[str] = Counter()
+                keyword_counts: Counter[str] = Counter()
+                for record in records:
+                    values, deck_id, opponent_name, keyword_ids = self._build_match_params(
+                        connection, record, keyword_lookup, name_lookup
+                    )
+                    params.append(values)
+                    deck_counts[deck_id] += 1
+                    if opponent_name:
+                        opponent_counts[opponent_name] += 1
+                    keyword_counts.update(keyword_ids)
+
+                if not params:
+                    return 0, 0
+
+                connection.executemany(_SQL_INSERT_MATCH, params)
+                last_id = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+                connection.executemany(
+                    "UPDATE decks SET usage_count = usage_count + ? WHERE id = ?",
+                    [(count, deck_id) for deck_id, count in deck_counts.items()],
+                )
+                connection.executemany(
+                    """
+                    INSERT INTO opponent_decks (name, usage_count)
+                    VALUES (?, ?)
+                    ON CONFLICT(name)
+                    DO UPDATE SET usage_count = usage_count + excluded.usage_count
+                    """,
+                    list(opponent_counts.items()),
+                )
+                connection.executemany(
+                    """
+                    UPDATE keywords
+                    SET usage_count = usage_count + ?
+                    WHERE identifier = ?
+                    """,
+                    [
+                        (count, identifier)
+                        for identifier, count in keyword_counts.items()
+                    ],
+                )
+                return len(params), int(last_id)
+        except sqlite3.DatabaseError as exc:  # pragma: no cover - defensive
+            log_error("Failed to record match", exc, count=len(params))
+            raise DatabaseError("Failed to record match") from exc
+
+    def _build_match_params(
+        self,
+        connection: sqlite3.Connection,
+        record: dict[str, object],
+        keyword_lookup: dict[str, dict[str, object]],
+        name_lookup: dict[str, str],
+    ) -> tuple[tuple[object, ...], int, str, list[str]]:
+        """対戦ログ辞書を検証し、INSERT 用のパラメータへ変換します。
+
+        入力
+            connection: ``sqlite3.Connection``
+                デッキ/シーズン解決に用いるコネクション。
+            record: ``dict[str, object]``
+                :meth:`record_match` と同じ形式の対戦ログ辞書。
+            keyword_lookup / name_lookup:
+                :meth:`_build_keyword_lookups` が返すルックアップ辞書。
+        出力
+            ``tuple[tuple[object, ...], int, str, list[str]]``
+                (INSERT パラメータ, デッキ ID, 対戦相手名, キーワード ID 一覧)。
+        処理概要
+            1. 先攻/後攻・勝敗・デッキ名を検証し、不正な場合は ``DatabaseError``。
+            2. YouTube 関連値・シーズン・キーワードを正規化します。
+        """
         try:
             turn_value = self._encode_turn(record["turn"])
             result_value = self._encode_result(record["result"])
@@ -1328,99 +1609,41 @@ class DatabaseManager:
         season_input = record.get("season_id")
         season_name_input = record.get("season_name")
 
-        try:
-            with self._connect() as connection:
-                deck_id = self._get_deck_id(connection, deck_name)
-                if season_input not in (None, ""):
-                    try:
-                        candidate = int(season_input)
-                    except (TypeError, ValueError) as exc:
-                        raise DatabaseError("シーズン ID が不正です") from exc
-                    if candidate <= 0:
-                        raise DatabaseError("シーズン ID が不正です")
-                    season_id = candidate
-                elif season_name_input:
-                    season_id = self._find_season_id(
-                        connection, str(season_name_input or "")
-                    )
-                    if season_name_input and season_id is None:
-                        raise DatabaseError("指定したシーズンが見つかりません")
-                keyword_lookup, name_lookup = self._build_keyword_lookups(connection)
-                filtered_keywords = [
-                    str(value or "").strip()
-                    for value in raw_keywords
-                    if str(value or "").strip()
-                ]
-                keyword_ids = self._sanitize_keyword_ids_from_lookup(
-                    keyword_lookup, name_lookup, raw_keywords
-                )
-                if filtered_keywords and not keyword_ids:
-                    raise DatabaseError("存在しないキーワードが含まれています")
-                keywords_json = json.dumps(keyword_ids, ensure_ascii=False)
-                connection.execute(
-                    """
-                    INSERT INTO matches (
-                        match_no,
-                        deck_id,
-                        season_id,
-                        turn,
-                        opponent_deck,
-                        keywords,
-                        memo,
-                        result,
-                        youtube_flag,
-                        youtube_url,
-                        youtube_video_id,
-                        youtube_checked_at,
-                        favorite
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record.get("match_no", 0),
-                        deck_id,
-                        season_id,
-                        turn_value,
-                        opponent_name if opponent_name else None,
-                        keywords_json,
-                        memo_value,
-                        result_value,
-                        youtube_flag,
-                        youtube_url,
-                        youtube_video_id,
-                        youtube_checked_at,
-                        favorite_flag,
-                    ),
-                )
-
-                connection.execute(
-                    "UPDATE decks SET usage_count = usage_count + 1 WHERE id = ?",
-                    (deck_id,),
-                )
-
-                if opponent_name:
-                    connection.execute(
-                        """
-                        INSERT INTO opponent_decks (name, usage_count)
-                        VALUES (?, 1)
-                        ON CONFLICT(name)
-                        DO UPDATE SET usage_count = usage_count + 1
-                        """,
-                        (opponent_name,),
-                    )
-
-                for identifier in keyword_ids:
-                    connection.execute(
-                        """
-                        UPDATE keywords
-                        SET usage_count = usage_count + 1
-                        WHERE identifier = ?
-                        """,
-                        (identifier,),
-                    )
-        except sqlite3.DatabaseError as exc:  # pragma: no cover - defensive
-            log_error("Failed to record match", exc, record=record)
-            raise DatabaseError("Failed to record match") from exc
+        deck_id = self._get_deck_id(connection, deck_name)
+        if season_input not in (None, ""):
+            try:
+                candidate = int(season_input)
+            except (TypeError, ValueError) as exc:
+                raise DatabaseError("シーズン ID が不正です") from exc
+            if candidate <= 0:
+                raise DatabaseError("シーズン ID が不正です")
+            season_id = candidate
+        elif season_name_input:
+            season_id = self._find_season_id(connection, str(season_name_input or ""))
+            if season_name_input and season_id is None:
+                raise DatabaseError("指定したシーズンが見つかりません")
+        keyword_ids = self._sanitize_keyword_ids_from_lookup(
+            keyword_lookup, name_lookup, raw_keywords
+        )
+        if not keyword_ids and any(str(value or "").strip() for value in raw_keywords):
+            raise DatabaseError("存在しないキーワードが含まれています")
+        keywords_json = _json_dumps(keyword_ids)
+        values = (
+            record.get("match_no", 0),
+            deck_id,
+            season_id,
+            turn_value,
+            opponent_name if opponent_name else None,
+            keywords_json,
+            memo_value,
+            result_value,
+            youtube_flag,
+            youtube_url,
+            youtube_video_id,
+            youtube_checked_at,
+            favorite_flag,
+        )
+        return values, deck_id, opponent_name, keyword_ids
 
     def record_recording(
         self,
@@ -1461,14 +1684,19 @@ class DatabaseManager:
         """登録済みの対戦相手デッキ一覧を名称順で返却。"""
 
         with self._connect() as connection:
-            cursor = connection.execute(
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            cursor.execute(
                 """
                 SELECT name, usage_count
                 FROM opponent_decks
                 ORDER BY name COLLATE NOCASE
                 """
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [
+                {"name": name, "usage_count": usage_count}
+                for name, usage_count in cursor.fetchall()
+            ]
 
     def fetch_keywords(self) -> list[dict[str, object]]:
         """登録済みキーワード一覧を名称順で返却。"""
@@ -1497,8 +1725,8 @@ class DatabaseManager:
                         "description": row["description"] or "",
                         "usage_count": row["usage_count"],
                         "created_at": self._format_timestamp(row["created_at"]),
-                        "is_protected": bool(row["is_protected"]) if "is_protected" in row.keys() else False,
-                        "is_hidden": bool(row["is_hidden"]) if "is_hidden" in row.keys() else False,
+                        "is_protected": bool(row["is_protected"]),
+                        "is_hidden": bool(row["is_hidden"]),
                     }
                 )
             return results
@@ -1799,10 +2027,16 @@ class DatabaseManager:
             if match_no <= 0:
                 raise DatabaseError("対戦番号には 1 以上の値を指定してください")
 
-            turn_input = updates.get("turn", self._decode_turn(row["turn"]))
+            turn_input = (
+                updates["turn"] if "turn" in updates else self._decode_turn(row["turn"])
+            )
             turn_value = self._encode_turn(turn_input)
 
-            result_input = updates.get("result", self._decode_result(row["result"]))
+            result_input = (
+                updates["result"]
+                if "result" in updates
+                else self._decode_result(row["result"])
+            )
             result_value = self._encode_result(result_input)
 
             opponent_input = updates.get("opponent_deck", row["opponent_deck"] or "")
@@ -1812,7 +2046,9 @@ class DatabaseManager:
                 updates.get("youtube_url", row["youtube_url"] or "")
             )
 
-            favorite_input = updates.get("favorite", bool(row["favorite"]))
+            favorite_input = (
+                updates["favorite"] if "favorite" in updates else bool(row["favorite"])
+            )
             if isinstance(favorite_input, str):
                 normalized_favorite = favorite_input.strip().lower()
                 favorite_flag = (
@@ -1831,7 +2067,7 @@ class DatabaseManager:
             current_keywords_raw: list[object] = []
             if row["keywords"]:
                 try:
-                    current_keywords_raw = json.loads(row["keywords"])
+                    current_keywords_raw = _json_loads(row["keywords"])
                 except json.JSONDecodeError:
                     current_keywords_raw = []
             old_keyword_ids = self._sanitize_keyword_ids_from_lookup(
@@ -1840,20 +2076,17 @@ class DatabaseManager:
 
             if "keywords" in updates:
                 new_keywords_input = updates.get("keywords") or []
-                filtered_new_keywords = [
-                    str(value or "").strip()
-                    for value in new_keywords_input
-                    if str(value or "").strip()
-                ]
                 new_keyword_ids = self._sanitize_keyword_ids_from_lookup(
                     keyword_lookup, name_lookup, new_keywords_input
                 )
-                if filtered_new_keywords and not new_keyword_ids:
+                if not new_keyword_ids and any(
+                    str(value or "").strip() for value in new_keywords_input
+                ):
                     raise DatabaseError("選択したキーワードが存在しません")
             else:
                 new_keyword_ids = list(old_keyword_ids)
 
-            keywords_json = json.dumps(new_keyword_ids, ensure_ascii=False)
+            keywords_json = _json_dumps(new_keyword_ids)
 
             old_opponent = row["opponent_deck"] or ""
 
@@ -2102,7 +2335,7 @@ class DatabaseManager:
             if row["keywords"]:
                 try:
                     keyword_ids = self._sanitize_keyword_ids_from_lookup(
-                        keyword_lookup, name_lookup, json.loads(row["keywords"])
+                        keyword_lookup, name_lookup, _json_loads(row["keywords"])
                     )
                 except json.JSONDecodeError:
                     keyword_ids = []
@@ -2167,20 +2400,17 @@ class DatabaseManager:
                         (int(row["match_count"]), deck_id),
                     )
 
-            cursor = connection.execute("SELECT name FROM opponent_decks")
-            for row in cursor.fetchall():
-                name = row["name"]
-                if not name:
-                    continue
-                count_row = connection.execute(
-                    "SELECT COUNT(*) FROM matches WHERE TRIM(opponent_deck) = TRIM(?)",
-                    (name,),
-                ).fetchone()
-                usage = int(count_row[0]) if count_row else 0
-                connection.execute(
-                    "UPDATE opponent_decks SET usage_count = ? WHERE name = ?",
-                    (usage, name),
+            # matches 側は書き込み時と v0.4.2 移行で TRIM 済みのため、
+            # idx_matches_opponent_deck を使う等価比較で集計する
+            connection.execute(
+                """
+                UPDATE opponent_decks
+                SET usage_count = (
+                    SELECT COUNT(*) FROM matches
+                    WHERE matches.opponent_deck = TRIM(opponent_decks.name)
                 )
+                """
+            )
 
     def recalculate_keyword_usage(self) -> None:
         """キーワードの使用回数を対戦ログから再計算する。"""
@@ -2196,7 +2426,7 @@ class DatabaseManager:
                 if not row["keywords"]:
                     continue
                 try:
-                    raw_keywords = json.loads(row["keywords"])
+                    raw_keywords = _json_loads(row["keywords"])
                 except json.JSONDecodeError:
                     continue
                 keyword_ids = self._sanitize_keyword_ids_from_lookup(
@@ -2355,22 +2585,20 @@ class DatabaseManager:
             ``dict[str, object]``
                 UI へ返却するためのフラットな辞書。
         処理概要
-            1. 保存されているキーワード JSON を復元し ID を整理。
-            2. ターンや結果などをデコードし、表示用フィールドへまとめます。
+            1. ``dict(row)`` で行を辞書化し、保存されているキーワード JSON を復元。
+            2. ターンや結果などを同じ辞書上でデコードし、表示用フィールドへ整えます。
         """
+        record = dict(row)
+        record.pop("deck_id", None)
+
         raw_keywords: list[object] = []
-        if row["keywords"]:
+        keywords_raw = record.get("keywords")
+        if keywords_raw:
             try:
-                raw_keywords = json.loads(row["keywords"])
+                raw_keywords = _json_loads(keywords_raw)
             except json.JSONDecodeError:
                 raw_keywords = []
 
-        rank_flag = (
-            bool(row["rank_statistics_target"])
-            if "rank_statistics_target" in row.keys()
-            else False
-        )
-
         keyword_ids = self._sanitize_keyword_ids_from_lookup(
             keyword_lookup, name_lookup, raw_keywords
         )
@@ -2378,59 +2606,49 @@ class DatabaseManager:
             keyword_lookup, keyword_ids
         )
 
-        youtube_flag_value = 0
-        if "youtube_flag" in row.keys():
+        youtube_flag_raw = record.get("youtube_flag")
+        if isinstance(youtube_flag_raw, int):
+            youtube_flag_value = youtube_flag_raw
+        else:
             try:
-                youtube_flag_value = int(row["youtube_flag"] or 0)
+                youtube_flag_value = int(youtube_flag_raw or 0)
             except (TypeError, ValueError):
                 youtube_flag_value = 0
-        try:
-            youtube_status = YouTubeSyncFlag(youtube_flag_value)
-        except ValueError:
-            youtube_status = YouTubeSyncFlag.NOT_REQUESTED
+        youtube_status = _YOUTUBE_STATUS_NAMES.get(
+            youtube_flag_value, _YOUTUBE_STATUS_DEFAULT
+        )
 
+        youtube_checked_raw = record.get("youtube_checked_at")
         youtube_checked_iso = ""
         youtube_checked_epoch: int | None = None
-        if "youtube_checked_at" in row.keys() and row["youtube_checked_at"] not in (None, ""):
-            try:
-                youtube_checked_epoch = int(row["youtube_checked_at"])
-            except (TypeError, ValueError):
-                youtube_checked_epoch = None
-            youtube_checked_iso = self._format_timestamp(row["youtube_checked_at"])
-
-        youtube_url_value = ""
-        if "youtube_url" in row.keys():
-            youtube_url_value = row["youtube_url"] or ""
-
-        youtube_video_id_value = ""
-        if "youtube_video_id" in row.keys():
-            youtube_video_id_value = row["youtube_video_id"] or ""
-
-        favorite_value = bool(row["favorite"]) if "favorite" in row.keys() else False
-
-        return {
-            "id": row["id"],
-            "match_no": row["match_no"],
-            "deck_name": row["deck_name"],
-            "season_id": row["season_id"],
-            "season_name": row["season_name"] or "",
-            "rank_statistics_target": rank_flag,
-            "turn": self._decode_turn(row["turn"]),
-            "opponent_deck": row["opponent_deck"] or "",
-            "keywords": [item["name"] for item in keyword_details],
-            "keyword_ids": keyword_ids,
-            "keyword_details": keyword_details,
-            "memo": row["memo"] or "",
-            "result": self._decode_result(row["result"]),
-            "created_at": self._format_timestamp(row["created_at"]),
-            "youtube_flag": int(youtube_flag_value),
-            "youtube_status": youtube_status.name.lower(),
-            "youtube_url": youtube_url_value,
-            "youtube_video_id": youtube_video_id_value,
-            "youtube_checked_at": youtube_checked_iso,
-            "youtube_checked_at_epoch": youtube_checked_epoch,
-            "favorite": favorite_value,
-        }
+        if youtube_checked_raw not in (None, ""):
+            if isinstance(youtube_checked_raw, int):
+                youtube_checked_epoch = youtube_checked_raw
+            else:
+                try:
+                    youtube_checked_epoch = int(youtube_checked_raw)
+                except (TypeError, ValueError):
+                    youtube_checked_epoch = None
+            youtube_checked_iso = self._format_timestamp(youtube_checked_raw)
+
+        record["season_name"] = record.get("season_name") or ""
+        record["rank_statistics_target"] = bool(record.get("rank_statistics_target"))
+        record["turn"] = self._decode_turn(record["turn"])
+        record["opponent_deck"] = record.get("opponent_deck") or ""
+        record["keywords"] = [item["name"] for item in keyword_details]
+        record["keyword_ids"] = keyword_ids
+        record["keyword_details"] = keyword_details
+        record["memo"] = record.get("memo") or ""
+        record["result"] = self._decode_result(record["result"])
+        record["created_at"] = self._format_timestamp(record["created_at"])
+        record["youtube_flag"] = youtube_flag_value
+        record["youtube_status"] = youtube_status
+        record["youtube_url"] = record.get("youtube_url") or ""
+        record["youtube_video_id"] = record.get("youtube_video_id") or ""
+        record["youtube_checked_at"] = youtube_checked_iso
+        record["youtube_checked_at_epoch"] = youtube_checked_epoch
+        record["favorite"] = bool(record.get("favorite"))
+        return record
 
     def _build_keyword_lookups(
         self, connection: sqlite3.Connection
@@ -2493,12 +2711,10 @@ class DatabaseManager:
             candidate = str(value or "").strip()
             if not candidate:
                 continue
-            identifier = None
-            lower = candidate.lower()
             if candidate in keyword_lookup:
                 identifier = candidate
-            elif lower in name_lookup:
-                identifier = name_lookup[lower]
+            else:
+                identifier = name_lookup.get(candidate.lower())
             if identifier and identifier not in seen:
                 seen.add(identifier)
                 sanitized.append(identifier)
@@ -2566,7 +2782,7 @@ class DatabaseManager:
             ts = int(value)
         except (TypeError, ValueError):
             return ""
-        return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+        return _epoch_to_iso(ts)
 
     @staticmethod
     def _sanitize_youtube_url(value: object) -> str:
@@ -2645,11 +2861,9 @@ class DatabaseManager:
         if isinstance(value, (int, float)):
             return 1 if int(value) != 0 else 0
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"1", "true", "first", "先攻"}:
-                return 1
-            if normalized in {"0", "false", "second", "後攻"}:
-                return 0
+            encoded = TURN_ALIASES.get(value.strip().lower())
+            if encoded is not None:
+                return encoded
         raise ValueError(f"Unsupported turn value: {value!r}")
 
     @staticmethod
@@ -2663,28 +2877,15 @@ class DatabaseManager:
             ``int``
                 勝ち ``1``、負け ``-1``、引き分け ``0``。
         処理概要
-            1. 文字列の場合は事前定義のマッピングを参照し、該当しない場合は整数化を試みます。
+            1. 文字列の場合はモジュール定数の別名表を一度だけ参照します。
             2. 未対応の値は :class:`ValueError` を送出します。
         """
         if isinstance(value, (int, float)):
             return int(value)
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            mapping = {
-                "win": 1,
-                "lose": -1,
-                "loss": -1,
-                "draw": 0,
-                "victory": 1,
-                "敗北": -1,
-                "勝ち": 1,
-                "負け": -1,
-                "引き分け": 0,
-            }
-            if normalized in mapping:
-                return mapping[normalized]
-            if normalized in {"1", "-1", "0"}:
-                return int(normalized)
+            encoded = RESULT_ALIASES.get(value.strip().lower())
+            if encoded is not None:
+                return encoded
         raise ValueError(f"Unsupported result value: {value!r}")
 
     @staticmethod
@@ -2705,11 +2906,7 @@ class DatabaseManager:
         if isinstance(value, (int, float)):
             return int(value) != 0
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"first", "先攻", "true", "1"}:
-                return True
-            if normalized in {"second", "後攻", "false", "0"}:
-                return False
+            return TURN_ALIASES.get(value.strip().lower()) == 1
         return False
 
     @staticmethod
@@ -2723,27 +2920,13 @@ class DatabaseManager:
             ``int``
                 勝ち ``1``、負け ``-1``、引き分け ``0``。解釈不能な場合も 0。
         処理概要
-            1. 文字列の場合は定義済みマッピングを適用し、該当しない場合は整数化を試みます。
+            1. 文字列の場合はモジュール定数の別名表を一度だけ参照します。
             2. いずれも該当しない場合は 0 を返します。
         """
         if isinstance(value, (int, float)):
             return int(value)
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            mapping = {
-                "win": 1,
-                "victory": 1,
-                "lose": -1,
-                "loss": -1,
-                "draw": 0,
-                "勝ち": 1,
-                "負け": -1,
-                "引き分け": 0,
-            }
-            if normalized in mapping:
-                return mapping[normalized]
-            if normalized in {"1", "-1", "0"}:
-                return int(normalized)
+            return RESULT_ALIASES.get(value.strip().lower(), 0)
         return 0
 
 
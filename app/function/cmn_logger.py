@@ -3,6 +3,7 @@
 記載内容
     - :func:`log_error`: 任意のエラー情報をテキストログへ記録。
     - :func:`log_db_error`: データベース関連エラーのラッパー。
+    - :func:`flush_logs`: 書き込み待ちのログを全てファイルへ反映。
 
 想定参照元
     - :mod:`app.main` や :mod:`app.function.cmn_database` の例外ハンドリング部分。
@@ -11,6 +12,10 @@
 
 from __future__ import annotations
 
+import atexit
+import queue
+import sys
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +29,82 @@ from app.function.core import paths
 
 _LOG_DIR = paths.log_dir()
 
+# 呼び出し元スレッド（UI/Eel のハンドラ）でファイル I/O を行わないよう、
+# 整形済みのログをキューへ積み、専用のデーモンスレッドがまとめて書き込む。
+_QUEUE: "queue.Queue[tuple[Path, str]]" = queue.Queue()
+_WORKER: threading.Thread | None = None
+_WORKER_LOCK = threading.Lock()
+
+
+def _write_batch(batch: list[tuple[Path, str]]) -> None:
+    """キューから取り出したログをファイル単位でまとめて追記します。"""
+
+    grouped: dict[Path, list[str]] = {}
+    for log_path, text in batch:
+        grouped.setdefault(log_path, []).append(text)
+
+    for log_path, texts in grouped.items():
+        try:
+            # 追記モードでファイルへ書き込み。`with` 文により自動的にクローズされる。
+            # 各エントリは改行込みで整形済みのため、1 回の write() で追記する。
+            with log_path.open("a", encoding="utf-8", buffering=8192) as stream:
+                stream.write("".join(texts))
+        except OSError as exc:  # pragma: no cover - defensive
+            # ログ出力自体の失敗は呼び出し元へ伝播できないため標準エラーへ退避する。
+            print(f"Failed to write log file {log_path}: {exc}", file=sys.stderr)
+            sys.stderr.write("".join(texts))
+
+
+def _drain() -> None:
+    """ログキューを監視し、溜まった分を一括で書き込み続けます。"""
+
+    while True:
+        batch = [_QUEUE.get()]
+        while True:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        finally:
+            for _ in batch:
+                _QUEUE.task_done()
+
+
+def _ensure_worker() -> None:
+    """書き込みスレッドが未起動であれば起動します。"""
+
+    global _WORKER
+    if _WORKER is not None and _WORKER.is_alive():
+        return
+    with _WORKER_LOCK:
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(
+                target=_drain, name="dpl-log-writer", daemon=True
+            )
+            _WORKER.start()
+
+
+def flush_logs() -> None:
+    """書き込み待ちのログが全てファイルへ反映されるまで待機します。
+
+    入力
+        引数はありません。
+    出力
+        ``None``
+    処理概要
+        1. 書き込みスレッドが動作中であれば、キューが空になるまでブロックします。
+        2. 終了時にも :mod:`atexit` から呼び出され、ログの取りこぼしを防ぎます。
+    """
+
+    if _WORKER is None:
+        return
+    _QUEUE.join()
+
+
+atexit.register(flush_logs)
+
 
 def log_error(message: str, exc: BaseException | None = None, **context: Any) -> Path:
     """詳細なエラーログを出力しファイルパスを返します。
@@ -39,8 +120,9 @@ def log_error(message: str, exc: BaseException | None = None, **context: Any) ->
         ``Path``
             追記されたログファイルのパス。
     処理概要
-        1. 日付単位でログファイルを切り替え、ヘッダー行・コンテキスト・トレースバックを書き込みます。
-        2. 最終的にログファイルパスを返却します。
+        1. 日付単位でログファイルを切り替え、ヘッダー行・コンテキスト・トレースバックを整形します。
+        2. 整形済みテキストを書き込みキューへ積み、ファイル I/O は専用スレッドへ任せます。
+        3. 最終的にログファイルパスを返却します（即時反映が必要なら :func:`flush_logs`）。
     """
 
     # 日付単位でログファイルを分ける。例: 20240101.log
@@ -60,10 +142,9 @@ def log_error(message: str, exc: BaseException | None = None, **context: Any) ->
     else:
         lines.append("No exception information available.")
 
-    # 追記モードでファイルへ書き込み。`with` 文により自動的にクローズされる。
-    with log_path.open("a", encoding="utf-8") as stream:
-        stream.write("\n".join(lines))
-        stream.write("\n")
+    _ensure_worker()
+    lines.append("")
+    _QUEUE.put((log_path, "\n".join(lines)))
 
     return log_path
 
@@ -89,4 +170,4 @@ def log_db_error(context: str, exc: Exception | None = None, **info: Any) -> Pat
     return log_error(context, exc, **info)
 
 
-__all__ = ["log_error", "log_db_error"]
+__all__ = ["log_error", "log_db_error", "flush_logs"]
@@ -2,7 +2,8 @@
 
 記載内容
     - :func:`get_text`: UI テキストをキーで検索する公開 API。
-    - 内部キャッシュ関数 :func:`_load_strings`。
+    - :func:`clear_text_cache`: 文字列リソースのキャッシュを破棄する公開 API。
+    - 内部キャッシュ関数 :func:`_load_strings` / :func:`_resolve_text`。
 
 想定参照元
     - :mod:`app.main` など、UI 文言を動的に取得するサービス層。
@@ -47,28 +48,72 @@ def _load_strings() -> dict[str, Any]:
         return json.load(stream)
 
 
-def get_text(path: str, default: Any | None = None) -> Any:
-    """ドット記法で指定した文字列リソースを取得します。
+# `_resolve_text` で「キーが見つからない」ことを表す番兵。
+_MISSING = object()
+
+
+@lru_cache(maxsize=512)
+def _resolve_text(path: str) -> Any:
+    """ドット区切りのキーを辿った結果をキャッシュします。
 
     入力
         path: ``str``
             ``"settings.title"`` のようなドット区切りのキー。
-        default: ``Any | None``
-            見つからない場合に返す既定値。未指定時はパス文字列を返します。
     出力
         ``Any``
-            該当する値。文字列が基本ですがネストされた辞書/配列も返る可能性があります。
+            該当する値。見つからない場合は ``_MISSING``。
     処理概要
         1. :func:`_load_strings` の結果をたどり ``path`` を段階的に探索。
-        2. 見つからない場合は ``default`` もしくはパス文字列を返却します。
+        2. ``lru_cache`` により同じキーの再探索（``split`` と辞書走査）を省きます。
     """
 
-    # `path` に `.` 区切りで指定されたキーを辿り、対応する値を返す。
     data: Any = _load_strings()
     for segment in path.split("."):
         if isinstance(data, dict) and segment in data:
             data = data[segment]
         else:
-            # 指定が誤っている場合は default、なければそのままキー文字列を返す。
-            return default if default is not None else path
+            return _MISSING
     return data
+
+
+def get_text(path: str, default: Any | None = None) -> Any:
+    """ドット記法で指定した文字列リソースを取得します。
+
+    入力
+        path: ``str``
+            ``"settings.title"`` のようなドット区切りのキー。
+        default: ``Any | None``
+            見つからない場合に返す既定値。未指定時はパス文字列を返します。
+    出力
+        ``Any``
+            該当する値。文字列が基本ですがネストされた辞書/配列も返る可能性があります。
+    処理概要
+        1. :func:`_resolve_text` でキャッシュ済みの探索結果を取得。
+        2. 見つからない場合は ``default`` もしくはパス文字列を返却します。
+    """
+
+    value = _resolve_text(path)
+    if value is _MISSING:
+        # 指定が誤っている場合は default、なければそのままキー文字列を返す。
+        return default if default is not None else path
+    return value
+
+
+def clear_text_cache() -> None:
+    """文字列リソースとキー探索結果のキャッシュを破棄します。
+
+    入力
+        引数はありません。
+    出力
+        ``None``
+    処理概要
+        1. :func:`_resolve_text` と :func:`_load_strings` のキャッシュをクリア。
+        2. 次回の :func:`get_text` 呼び出しで ``strings.json`` を読み直します。
+           言語切り替えやリソース差し替え時に呼び出してください。
+    """
+
+    _resolve_text.cache_clear()
+    _load_strings.cache_clear()
+
+
+__all__ = ["get_text", "clear_text_cache"]
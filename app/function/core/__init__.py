@@ -15,6 +15,7 @@ __all__ = [
     "versioning",
     "backup_restore",
     "csv_schema_map",
+    "match_aliases",
     "migration_runner",
     "config_handler",
     "ffmpeg_command_builder",
@@ -14,6 +14,7 @@ from tempfile import TemporaryDirectory
 from typing import Iterable, Sequence
 
 from . import paths
+from .match_aliases import RESULT_ALIASES, TURN_ALIASES
 from .csv_schema_map import (
     ColumnSpec,
     ColumnType,
@@ -71,8 +72,8 @@ class RestoreError(RuntimeError):
         self.failures = list(failures or [])
 
 
-_TRUTHY = {"1", "true", "yes", "on"}
-_FALSEY = {"0", "false", "no", "off"}
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_FALSEY = frozenset({"0", "false", "no", "off"})
 
 
 def restore_from_directory(
@@ -363,7 +364,7 @@ def _convert_value(raw_value: str | None, spec: ColumnSpec) -> object:
             return None
 
     if spec.type == ColumnType.TEXT:
-        return text_value
+        return normalized if spec.strip else text_value
 
     if spec.type == ColumnType.JSON:
         candidate = text_value if normalized else (spec.default or "[]")
@@ -409,31 +410,16 @@ def _convert_value(raw_value: str | None, spec: ColumnSpec) -> object:
 
 
 def _convert_turn(value: str) -> int:
-    lowered = value.strip().lower()
-    if lowered in {"1", "true", "first", "先攻"}:
-        return 1
-    if lowered in {"0", "false", "second", "後攻"}:
-        return 0
+    converted = TURN_ALIASES.get(value.strip().lower())
+    if converted is not None:
+        return converted
     raise ValueError(f"invalid turn value: {value}")
 
 
 def _convert_result(value: str) -> int:
-    lowered = value.strip().lower()
-    mapping = {
-        "1": 1,
-        "win": 1,
-        "victory": 1,
-        "勝ち": 1,
-        "-1": -1,
-        "lose": -1,
-        "loss": -1,
-        "敗北": -1,
-        "0": 0,
-        "draw": 0,
-        "引き分け": 0,
-    }
-    if lowered in mapping:
-        return mapping[lowered]
+    converted = RESULT_ALIASES.get(value.strip().lower())
+    if converted is not None:
+        return converted
     raise ValueError(f"invalid result value: {value}")
 
 
@@ -28,7 +28,7 @@ class ColumnType(str, Enum):
     RESULT = "result"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnSpec:
     """Schema metadata for a single CSV column."""
 
@@ -36,9 +36,10 @@ class ColumnSpec:
     type: ColumnType
     nullable: bool = True
     default: object | None = None
+    strip: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableSchema:
     """Schema definition for a single table."""
 
@@ -106,7 +107,7 @@ SCHEMA_BY_TABLE: Mapping[str, TableSchema] = {
             "deck_id": ColumnSpec("deck_id", ColumnType.INTEGER, nullable=False),
             "season_id": ColumnSpec("season_id", ColumnType.INTEGER),
             "turn": ColumnSpec("turn", ColumnType.TURN, nullable=False),
-            "opponent_deck": ColumnSpec("opponent_deck", ColumnType.TEXT),
+            "opponent_deck": ColumnSpec("opponent_deck", ColumnType.TEXT, strip=True),
             "keywords": ColumnSpec(
                 "keywords", ColumnType.JSON, default="[]"
             ),
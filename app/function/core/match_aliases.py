@@ -0,0 +1,46 @@
+"""対戦記録の先攻/後攻・勝敗を表す文字列表記の対応表を定義するモジュール。
+
+DB への保存 (:mod:`app.function.cmn_database`) と CSV 復元
+(:mod:`app.function.core.backup_restore`) が同じ表記を受け付けるよう、
+小文字化済みの表記から保存用の整数値への対応を一箇所で管理します。
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Mapping
+
+__all__ = ["RESULT_ALIASES", "TURN_ALIASES"]
+
+
+TURN_ALIASES: Mapping[str, int] = MappingProxyType(
+    {
+        "1": 1,
+        "true": 1,
+        "first": 1,
+        "先攻": 1,
+        "0": 0,
+        "false": 0,
+        "second": 0,
+        "後攻": 0,
+    }
+)
+"""先攻 (1) / 後攻 (0) の表記対応表。"""
+
+RESULT_ALIASES: Mapping[str, int] = MappingProxyType(
+    {
+        "1": 1,
+        "win": 1,
+        "victory": 1,
+        "勝ち": 1,
+        "-1": -1,
+        "lose": -1,
+        "loss": -1,
+        "負け": -1,
+        "敗北": -1,
+        "0": 0,
+        "draw": 0,
+        "引き分け": 0,
+    }
+)
+"""勝ち (1) / 負け (-1) / 引き分け (0) の表記対応表。"""
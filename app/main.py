@@ -13,9 +13,11 @@
 from __future__ import annotations
 
 import base64
+import bisect
 import logging
 import os
 import sqlite3
+import string
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Mapping, Optional
@@ -47,9 +49,19 @@ from app.function.core.youtube_uploader import (
 logger = logging.getLogger(__name__)
 _WEB_ROOT = paths.web_root()
 _INDEX_FILE = "index.html"
+_TRUTHY_STRINGS = frozenset({"1", "true", "yes", "on"})
+_RESULT_LABELS: Mapping[int, str] = {1: "Win", -1: "Lose", 0: "Draw"}
+_NOCASE_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 _SERVICE: Optional["DuelPerformanceService"] = None
 
 
+class _SafeFormatDict(dict):
+    """``str.format_map`` 用に未定義キーを空文字へ置き換える辞書。"""
+
+    def __missing__(self, key: str) -> str:  # pragma: no cover - fallback
+        return ""
+
+
 class DuelPerformanceService:
     """データベース操作とアプリ状態生成を一手に担うサービス層クラス。
 
@@ -80,6 +92,7 @@ class DuelPerformanceService:
         self._recorder: FFmpegRecorder | None = None
         self._last_recording_result: RecordingResult | None = None
         self._last_screenshot_path: str | None = None
+        self._state: AppState | None = None
         self.db = DatabaseManager()
         self.youtube_uploader: YouTubeUploader | None = None
         try:
@@ -164,6 +177,43 @@ class DuelPerformanceService:
             migration_result=self.migration_result,
             migration_timestamp=self.migration_timestamp,
         )
+        self._state = set_app_state(state)
+        return self._state
+
+    @property
+    def state(self) -> AppState:
+        """直近に構築した状態を返します。未構築時のみ :meth:`refresh_state` を実行します。"""
+
+        if self._state is None:
+            return self.refresh_state()
+        return self._state
+
+    def _refresh_sections(self, *sections: str) -> AppState:
+        """変更のあったリストだけを DB から再取得して状態を更新します。
+
+        入力
+            sections: ``str``
+                再取得する :class:`AppState` のフィールド名
+                (``decks`` / ``opponent_decks`` / ``keywords`` / ``seasons``)。
+        出力
+            :class:`AppState`
+                更新後の状態。未構築の場合は :meth:`refresh_state` の結果です。
+        処理概要
+            1. 状態が未構築であれば全件再構築へフォールバックします。
+            2. 指定されたフィールドのみ対応する ``fetch_*`` で置き換えます。
+        """
+
+        state = self._state
+        if state is None:
+            return self.refresh_state()
+        fetchers = {
+            "decks": self.db.fetch_decks,
+            "opponent_decks": self.db.fetch_opponent_decks,
+            "keywords": self.db.fetch_keywords,
+            "seasons": self.db.fetch_seasons,
+        }
+        for section in sections:
+            setattr(state, section, fetchers[section]())
         return set_app_state(state)
 
     def _record_migration_message(self, message: str) -> None:
@@ -225,20 +275,22 @@ class DuelPerformanceService:
 
         recorder = self._recorder
         is_recording = recorder.is_running() if recorder else False
+        last_result = self._last_recording_result
         last_recording: dict[str, Any] | None = None
-        if self._last_recording_result is not None:
+        if last_result is not None:
             last_recording = {
-                "path": str(self._last_recording_result.file_path),
-                "status": self._last_recording_result.status,
-                "profile": self._last_recording_result.profile.name,
-                "fps": self._last_recording_result.fps,
-                "bitrate": self._last_recording_result.bitrate,
+                "path": str(last_result.file_path),
+                "status": last_result.status,
+                "profile": last_result.profile.name,
+                "fps": last_result.fps,
+                "bitrate": last_result.bitrate,
             }
 
+        settings = self.recording_settings
         return {
-            "settings": self.recording_settings.to_dict(),
+            "settings": settings.to_dict(),
             "is_recording": is_recording,
-            "active_profile": self.recording_settings.profile,
+            "active_profile": settings.profile,
             "last_recording": last_recording,
             "last_screenshot": self._last_screenshot_path,
         }
@@ -322,14 +374,14 @@ class DuelPerformanceService:
         処理概要
             1. 文字列をトリムして必須入力を検証します。
             2. :meth:`DatabaseManager.add_deck` へ登録処理を委譲します。
-            3. :meth:`refresh_state` で最新状態を返却します。
+            3. :meth:`_refresh_sections` でデッキ一覧のみ再取得して返却します。
         """
         cleaned_name = (name or "").strip()
         if not cleaned_name:
             raise ValueError("デッキ名を入力してください")
         cleaned_description = (description or "").strip()
         self.db.add_deck(cleaned_name, cleaned_description)
-        return self.refresh_state()
+        return self._refresh_sections("decks")
 
     def register_opponent_deck(self, name: str) -> AppState:
         """対戦相手デッキを登録し最新状態を返します。
@@ -343,13 +395,13 @@ class DuelPerformanceService:
         処理概要
             1. 入力文字列のトリムと必須チェックを実施。
             2. :meth:`DatabaseManager.add_opponent_deck` で保存。
-            3. :meth:`refresh_state` を呼び最新状態を返却します。
+            3. :meth:`_refresh_sections` で相手デッキ一覧のみ再取得して返却します。
         """
         cleaned_name = (name or "").strip()
         if not cleaned_name:
             raise ValueError("対戦相手デッキ名を入力してください")
         self.db.add_opponent_deck(cleaned_name)
-        return self.refresh_state()
+        return self._refresh_sections("opponent_decks")
 
     def prepare_match(
         self, deck_name: str, season_id: Optional[int] = None
@@ -401,7 +453,10 @@ class DuelPerformanceService:
         処理概要
             1. デッキ名・先攻後攻・勝敗など必須項目の妥当性を検証します。
             2. キーワードやシーズン ID を正規化し、登録用辞書 ``match_record`` を生成します。
-            3. :meth:`DatabaseManager.record_match` を呼び出し、処理後に :meth:`refresh_state` を返します。
+            3. :meth:`DatabaseManager.record_match` を呼び出し、追加された 1 件だけを
+               取得して対戦履歴へ追記します。
+            4. 使用回数はキャッシュ済み一覧へ :meth:`_apply_match_usage` で加算し、
+               新規の対戦相手デッキなど反映できない場合のみ :meth:`_refresh_sections` で再取得します。
         """
         deck_name = str(payload.get("deck_name", "")).strip()
         if not deck_name:
@@ -418,11 +473,12 @@ class DuelPerformanceService:
         opponent = str(payload.get("opponent_deck", "")).strip()
         raw_keywords = payload.get("keywords", [])
         keywords: list[str] = []
-        if isinstance(raw_keywords, (list, tuple)):
-            for value in raw_keywords:
-                candidate = str(value or "").strip()
-                if candidate:
-                    keywords.append(candidate)
+        if raw_keywords and isinstance(raw_keywords, (list, tuple)):
+            keywords = [
+                candidate
+                for candidate in (str(value or "").strip() for value in raw_keywords)
+                if candidate
+            ]
         memo = str(payload.get("memo", "") or "")
         season_id_value = payload.get("season_id")
         season_name = str(payload.get("season_name", "") or "").strip()
@@ -447,8 +503,45 @@ class DuelPerformanceService:
         if normalized_season_id is None and season_name:
             match_record["season_name"] = season_name
 
-        self.db.record_match(match_record)
-        return self.refresh_state()
+        match_id = self.db.record_match(match_record)
+        if self._state is None:
+            return self.refresh_state()
+        match = self.db.fetch_match(match_id)
+        self._state.match_records.append(match)
+        if self._apply_match_usage(self._state, match):
+            return set_app_state(self._state)
+        return self._refresh_sections("decks", "opponent_decks", "keywords")
+
+    @staticmethod
+    def _apply_match_usage(state: AppState, match: Mapping[str, Any]) -> bool:
+        """登録済み対戦 1 件分の使用回数をキャッシュ済み一覧へ加算します。
+
+        一覧に存在しない名称（新規の対戦相手デッキなど）が含まれる場合は
+        何も変更せず ``False`` を返します。
+        """
+
+        deck = next(
+            (item for item in state.decks if item.get("name") == match.get("deck_name")),
+            None,
+        )
+        opponent_name = str(match.get("opponent_deck") or "")
+        opponent = None
+        if opponent_name:
+            opponent = next(
+                (item for item in state.opponent_decks if item.get("name") == opponent_name),
+                None,
+            )
+            if opponent is None:
+                return False
+        keyword_ids = set(match.get("keyword_ids") or ())
+        keywords = [item for item in state.keywords if item.get("identifier") in keyword_ids]
+        if deck is None or len(keywords) != len(keyword_ids):
+            return False
+
+        for item in (deck, opponent, *keywords):
+            if item is not None:
+                item["usage_count"] = int(item.get("usage_count") or 0) + 1
+        return True
 
     def delete_deck(self, name: str) -> AppState:
         """指定されたデッキを削除し状態を更新します。
@@ -462,13 +555,13 @@ class DuelPerformanceService:
         処理概要
             1. 引数をトリムし空の場合は :class:`ValueError` を送出します。
             2. :meth:`DatabaseManager.delete_deck` で削除処理を実行。
-            3. :meth:`refresh_state` の結果を返します。
+            3. :meth:`_refresh_sections` でデッキ一覧のみ再取得して返します。
         """
         cleaned = (name or "").strip()
         if not cleaned:
             raise ValueError("削除するデッキを選択してください")
         self.db.delete_deck(cleaned)
-        return self.refresh_state()
+        return self._refresh_sections("decks")
 
     def delete_opponent_deck(self, name: str) -> AppState:
         """対戦相手デッキを削除し状態を更新します。
@@ -482,13 +575,13 @@ class DuelPerformanceService:
         処理概要
             1. 文字列をトリムし、空の場合は :class:`ValueError` を送出。
             2. :meth:`DatabaseManager.delete_opponent_deck` で削除処理。
-            3. :meth:`refresh_state` を呼び最新状態を返します。
+            3. :meth:`_refresh_sections` で相手デッキ一覧のみ再取得して返します。
         """
         cleaned = (name or "").strip()
         if not cleaned:
             raise ValueError("削除する対戦相手デッキを選択してください")
         self.db.delete_opponent_deck(cleaned)
-        return self.refresh_state()
+        return self._refresh_sections("opponent_decks")
 
     def register_keyword(self, name: str, description: str) -> AppState:
         """キーワードを登録し状態を更新します。
@@ -504,14 +597,14 @@ class DuelPerformanceService:
         処理概要
             1. キーワード名を必須チェック。
             2. :meth:`DatabaseManager.add_keyword` で保存。
-            3. :meth:`refresh_state` の結果を返します。
+            3. :meth:`_refresh_sections` でキーワード一覧のみ再取得して返します。
         """
         cleaned_name = (name or "").strip()
         if not cleaned_name:
             raise ValueError("キーワード名を入力してください")
         cleaned_description = (description or "").strip()
         self.db.add_keyword(cleaned_name, cleaned_description)
-        return self.refresh_state()
+        return self._refresh_sections("keywords")
 
     def delete_keyword(self, identifier: str) -> AppState:
         """キーワードを削除して状態を更新します。
@@ -525,13 +618,13 @@ class DuelPerformanceService:
         処理概要
             1. 文字列をトリムし空であれば :class:`ValueError` を送出。
             2. :meth:`DatabaseManager.delete_keyword` に削除を委譲。
-            3. :meth:`refresh_state` の結果を返します。
+            3. :meth:`_refresh_sections` でキーワード一覧のみ再取得して返します。
         """
         cleaned = (identifier or "").strip()
         if not cleaned:
             raise ValueError("削除するキーワードを選択してください")
         self.db.delete_keyword(cleaned)
-        return self.refresh_state()
+        return self._refresh_sections("keywords")
 
     def set_keyword_visibility(self, identifier: str, hidden: bool) -> AppState:
         """キーワードの表示状態を切り替えて状態を更新します。"""
@@ -540,7 +633,7 @@ class DuelPerformanceService:
         if not cleaned:
             raise ValueError("キーワードを選択してください")
         self.db.set_keyword_visibility(cleaned, hidden)
-        return self.refresh_state()
+        return self._refresh_sections("keywords")
 
     def register_season(
         self,
@@ -569,7 +662,7 @@ class DuelPerformanceService:
             1. シーズン名の必須チェックを実施。
             2. 日付・時刻を正規化する内部関数 ``_normalize`` を利用。
             3. ランク統計対象フラグを正規化し、:meth:`DatabaseManager.add_season` で保存。
-            4. :meth:`refresh_state` を返します。
+            4. 採番 ID を付与した行を名称順を保ってキャッシュ済みシーズン一覧へ挿入して返します。
         """
         cleaned_name = (name or "").strip()
         if not cleaned_name:
@@ -590,16 +683,29 @@ class DuelPerformanceService:
                     return False
             return bool(value)
 
-        self.db.add_season(
+        season = {
+            "name": cleaned_name,
+            "notes": (notes or "").strip(),
+            "start_date": _normalize(start_date),
+            "start_time": _normalize(start_time),
+            "end_date": _normalize(end_date),
+            "end_time": _normalize(end_time),
+            "rank_statistics_target": _normalize_flag(rank_statistics_target),
+        }
+        season_id = self.db.add_season(
             cleaned_name,
-            (notes or "").strip(),
-            rank_statistics_target=_normalize_flag(rank_statistics_target),
-            start_date=_normalize(start_date),
-            start_time=_normalize(start_time),
-            end_date=_normalize(end_date),
-            end_time=_normalize(end_time),
+            season["notes"],
+            rank_statistics_target=season["rank_statistics_target"],
+            start_date=season["start_date"],
+            start_time=season["start_time"],
+            end_date=season["end_date"],
+            end_time=season["end_time"],
         )
-        return self.refresh_state()
+        state = self._state
+        if state is None:
+            return self.refresh_state()
+        bisect.insort(state.seasons, {"id": season_id, **season}, key=_season_sort_key)
+        return set_app_state(state)
 
     def delete_season(self, name: str) -> AppState:
         """シーズン情報を削除し状態を更新します。
@@ -612,14 +718,34 @@ class DuelPerformanceService:
                 削除後の状態。
         処理概要
             1. 引数をトリムし空の場合は :class:`ValueError` を送出。
-            2. :meth:`DatabaseManager.delete_season` を呼び出します。
-            3. :meth:`refresh_state` を返します。
+            2. キャッシュ済みシーズン一覧に存在しない場合は DB へ問い合わせず
+               :class:`DatabaseError` を送出し、存在すれば
+               :meth:`DatabaseManager.delete_season` を呼び出します。
+            3. 外部キー ``ON DELETE SET NULL`` と同じくキャッシュ済み対戦のシーズン情報を空にし、
+               キャッシュ済みシーズン一覧から該当行を取り除いて返します。
         """
         cleaned = (name or "").strip()
         if not cleaned:
             raise ValueError("削除するシーズンを選択してください")
+        state = self._state
+        if state is None:
+            self.db.delete_season(cleaned)
+            return self.refresh_state()
+        deleted = next(
+            (season for season in state.seasons if season.get("name") == cleaned),
+            None,
+        )
+        if deleted is None:
+            raise DatabaseError(f"シーズン「{cleaned}」が見つかりません")
         self.db.delete_season(cleaned)
-        return self.refresh_state()
+        deleted_id = deleted.get("id")
+        for match in state.match_records:
+            if match.get("season_id") == deleted_id:
+                match["season_id"] = None
+                match["season_name"] = ""
+                match["rank_statistics_target"] = False
+        state.seasons = [season for season in state.seasons if season is not deleted]
+        return set_app_state(state)
 
     def get_match_detail(self, match_id: int) -> dict[str, object]:
         """対戦記録の詳細を取得します。
@@ -943,13 +1069,11 @@ class DuelPerformanceService:
         }
 
     def _render_youtube_template(self, template: str, context: dict[str, str]) -> str:
-        class _SafeDict(dict):
-            def __missing__(self, key: str) -> str:  # pragma: no cover - fallback
-                return ""
-
-        safe_context = {key: str(value or "") for key, value in context.items()}
+        safe_context = _SafeFormatDict(
+            (key, str(value or "")) for key, value in context.items()
+        )
         try:
-            return template.format_map(_SafeDict(safe_context))
+            return template.format_map(safe_context)
         except (KeyError, ValueError):
             return template
 
@@ -978,8 +1102,7 @@ class DuelPerformanceService:
             numeric = int(value)
         except (TypeError, ValueError):
             return "Unknown"
-        mapping = {1: "Win", -1: "Lose", 0: "Draw"}
-        return mapping.get(numeric, "Unknown")
+        return _RESULT_LABELS.get(numeric, "Unknown")
 
     def _format_restore_lines(self, report: RestoreReport) -> list[str]:
         """復元結果をユーザー通知用メッセージへ整形します。"""
@@ -989,10 +1112,18 @@ class DuelPerformanceService:
                 decks=report.restored.get("decks", 0),
                 seasons=report.restored.get("seasons", 0),
                 matches=report.restored.get("matches", 0),
-            ),
+            )
+        ]
+        lines.extend(self._format_restore_failure_lines(report))
+        return lines
+
+    def _format_restore_failure_lines(self, report: RestoreReport) -> list[str]:
+        """復元時の失敗件数とログ出力先を通知用メッセージへ整形します。"""
+
+        lines = [
             get_text("settings.db_restore_failure_count").format(
                 count=len(report.failures)
-            ),
+            )
         ]
         if report.log_path:
             lines.append(
@@ -1052,17 +1183,7 @@ class DuelPerformanceService:
                 )
                 last_report = self.db.last_restore_report
                 if last_report:
-                    lines.append(
-                        get_text("settings.db_restore_failure_count").format(
-                            count=len(last_report.failures)
-                        )
-                    )
-                    if last_report.log_path:
-                        lines.append(
-                            get_text("settings.db_restore_log_path").format(
-                                path=str(last_report.log_path)
-                            )
-                        )
+                    lines.extend(self._format_restore_failure_lines(last_report))
                 message = "\n".join(
                     [get_text("settings.db_migration_failure").format(error=str(exc))]
                     + lines
@@ -1142,17 +1263,7 @@ class DuelPerformanceService:
                 )
                 last_report = self.db.last_restore_report
                 if last_report:
-                    lines.append(
-                        get_text("settings.db_restore_failure_count").format(
-                            count=len(last_report.failures)
-                        )
-                    )
-                    if last_report.log_path:
-                        lines.append(
-                            get_text("settings.db_restore_log_path").format(
-                                path=str(last_report.log_path)
-                            )
-                        )
+                    lines.extend(self._format_restore_failure_lines(last_report))
             else:
                 lines.extend(self._format_restore_lines(report))
 
@@ -1183,6 +1294,12 @@ def _ensure_service() -> DuelPerformanceService:
     return _SERVICE
 
 
+def _season_sort_key(season: Mapping[str, Any]) -> str:
+    """``ORDER BY name COLLATE NOCASE`` と同じ順序になるソートキーを返します。"""
+
+    return str(season.get("name") or "").translate(_NOCASE_FOLD)
+
+
 def _format_timestamp() -> str:
     """ローカル時刻を UI 用の文字列に整形して返します。
 
@@ -1241,7 +1358,8 @@ def _operation_response(service: DuelPerformanceService, func) -> dict[str, Any]
             ``{"ok": True/False, ...}`` 形式のレスポンス辞書。
     処理概要
         1. 操作を実行し、想定済みの例外を捕捉してエラーメッセージへ変換。
-        2. 成功時は :func:`_build_snapshot` を用いて最新状態を添付します。
+        2. 成功時は戻り値の状態（なければ :attr:`DuelPerformanceService.state`）を
+           :func:`_build_snapshot` に渡して添付します。
     """
     try:
         state = func()
@@ -1253,11 +1371,9 @@ def _operation_response(service: DuelPerformanceService, func) -> dict[str, Any]
     except ValueError as exc:
         return {"ok": False, "error": str(exc)}
     else:
-        if isinstance(state, AppState):
-            snapshot = _build_snapshot(state)
-        else:
-            snapshot = _build_snapshot()
-        return {"ok": True, "snapshot": snapshot}
+        if not isinstance(state, AppState):
+            state = service.state
+        return {"ok": True, "snapshot": _build_snapshot(state)}
 
 
 def _coerce_optional_int(value: Any) -> int | None:
@@ -1280,8 +1396,7 @@ def _coerce_bool(value: Any) -> bool:
         return False
     if isinstance(value, (int, float)):
         return bool(value)
-    text = str(value).strip().lower()
-    return text in {"1", "true", "yes", "on"}
+    return str(value).strip().lower() in _TRUTHY_STRINGS
 
 
 def _normalize_recording_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
@@ -1317,21 +1432,24 @@ def _normalize_recording_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
 
 
 @eel.expose
-def fetch_snapshot() -> dict[str, Any]:
+def fetch_snapshot(refresh: bool = True) -> dict[str, Any]:
     """フロントエンドへ最新スナップショットを返します。
 
     入力
-        引数はありません。
+        refresh: ``bool``
+            ``True`` の場合は DB から状態を再構築します。``False`` の場合は
+            サービスが保持している直近の状態を再利用します。
     出力
         ``dict[str, Any]``
             現在の状態を ``snapshot`` キーに含む辞書。
     処理概要
         1. :func:`_ensure_service` でサービスを取得。
-        2. :meth:`DuelPerformanceService.refresh_state` の結果を :func:`_build_snapshot` に渡して返却します。
+        2. ``refresh`` に応じて :meth:`DuelPerformanceService.refresh_state` または
+           :attr:`DuelPerformanceService.state` を :func:`_build_snapshot` に渡して返却します。
     """
 
     service = _ensure_service()
-    state = service.refresh_state()
+    state = service.refresh_state() if refresh else service.state
     return _build_snapshot(state)
 
 
@@ -1894,7 +2012,7 @@ def main() -> None:
     eel.init(str(_WEB_ROOT))
 
     # Preload data once so the first fetch does not need to hit disk.
-    _build_snapshot(service.refresh_state())
+    _build_snapshot(service.state)
 
     eel_mode = os.environ.get("DPL_EEL_MODE", "default")
     block = os.environ.get("DPL_NO_UI") != "1"
@@ -0,0 +1,10 @@
+DELETE FROM opponent_decks
+WHERE name <> TRIM(name)
+  AND EXISTS (
+      SELECT 1 FROM opponent_decks AS other
+      WHERE other.id <> opponent_decks.id
+        AND TRIM(other.name) = TRIM(opponent_decks.name)
+        AND (other.name = TRIM(other.name) OR other.id < opponent_decks.id)
+  );
+UPDATE opponent_decks SET name = TRIM(name) WHERE name <> TRIM(name) AND TRIM(name) <> '';
+UPDATE matches SET opponent_deck = TRIM(opponent_deck) WHERE opponent_deck <> TRIM(opponent_deck);
@@ -53,7 +53,6 @@ const keywordDescriptionInput = document.getElementById("keyword-description");
 const keywordTableBody = document.querySelector("#keyword-table tbody");
 const matchKeywordsContainer = document.getElementById("match-keywords");
 const matchKeywordsInput = document.getElementById("match-keywords-input");
-const matchEntryMemoInput = document.getElementById("match-entry-memo");
 const matchListTableBody = document.querySelector("#match-list-table tbody");
 const matchDetailTimestampEl = document.getElementById("match-detail-timestamp");
 const matchDetailDeckEl = document.getElementById("match-detail-deck");
@@ -74,6 +73,8 @@ const matchDetailRecordingPathInput = document.getElementById("match-detail-reco
 const matchDetailFavoriteEl = document.getElementById("match-detail-favorite");
 const matchDetailEditButton = document.getElementById("match-detail-edit");
 const matchEditForm = document.getElementById("match-edit-form");
+const matchEditTurnInputs = matchEditForm?.elements.namedItem("turn") ?? null;
+const matchEditResultInputs = matchEditForm?.elements.namedItem("result") ?? null;
 const matchEditDeckSelect = document.getElementById("match-edit-deck");
 const matchEditNumberInput = document.getElementById("match-edit-number");
 const matchEditOpponentSelect = document.getElementById("match-edit-opponent");
@@ -102,6 +103,21 @@ const YOUTUBE_STATUS_MAP = {
   4: { label: "手動登録済", tone: "info" },
 };
 
+const COUNT_FORMATTER = new Intl.NumberFormat("ja-JP");
+const CHART_FONT_FAMILY = "'Segoe UI', 'BIZ UDPGothic', sans-serif";
+const CHART_FONT_EMPTY = `16px ${CHART_FONT_FAMILY}`;
+const CHART_FONT_LABEL = `12px ${CHART_FONT_FAMILY}`;
+const CHART_FONT_POINT = `11px ${CHART_FONT_FAMILY}`;
+const CHART_PADDING = { left: 64, right: 48, top: 32, bottom: 72 };
+const CHART_LABEL_ROTATION = (-45 * Math.PI) / 180;
+const CHART_FULL_ARC = Math.PI * 2;
+const ANALYSIS_CHART_OPTIONS = Object.freeze({
+  labelKey: "label",
+  countAxisLabel: "試合数",
+  rateAxisLabel: "勝率",
+});
+const MATCH_LIST_CHUNK_SIZE = 200;
+
 const viewElements = new Map();
 let currentView = "dashboard";
 
@@ -119,8 +135,32 @@ for (const view of document.querySelectorAll(".view")) {
 }
 
 const viewStack = [];
+const deckRowPool = [];
+const staleViews = new Set();
+const deferredViewRenderers = new Map([
+  ["deck-registration", () => renderDeckTable(latestSnapshot?.decks ?? [])],
+  [
+    "opponent-deck-registration",
+    () => renderOpponentDeckTable(latestSnapshot?.opponent_decks ?? []),
+  ],
+  ["keyword-management", () => renderKeywordTable(latestSnapshot?.keywords ?? [])],
+  ["season-registration", () => renderSeasonTable(latestSnapshot?.seasons ?? [])],
+  [
+    "match-entry",
+    () =>
+      populateOpponentOptions(latestSnapshot?.opponent_decks ?? [], {
+        select: null,
+        input: matchOpponentInput,
+        list: matchOpponentList,
+      }),
+  ],
+  ["match-list", () => renderMatchList(latestMatchRecords)],
+  ["deck-analysis", () => updateDeckAnalysisView()],
+  ["opponent-analysis", () => updateOpponentAnalysisView()],
+]);
 let toastTimer = null;
 let latestSnapshot = null;
+let latestMatchRecords = [];
 const matchEntryState = {
   deckName: "",
   matchNumber: null,
@@ -131,18 +171,32 @@ const matchEntryState = {
 let currentMatchDetail = null;
 
 let matchEntryClockTimer = null;
+let matchEntrySubmitting = false;
+let matchListRenderToken = 0;
 
 const keywordToggleState = {
   entry: new Set(),
   edit: new Set(),
 };
+const keywordToggleKeys = {
+  entry: null,
+  edit: null,
+};
 
 let deckAnalysisData = [];
 let opponentAnalysisData = [];
 let recordingState = null;
+let appliedRecordingSettingsKey = null;
+let seasonsById = new Map();
+const SEASON_PERIOD_CACHE_LIMIT = 256;
+const seasonPeriodCache = new Map();
 
 const SEASON_FILTER_ALL = "__ALL__";
 const SEASON_FILTER_RANK = "__RANK__";
+const ANALYSIS_BASE_FILTER_OPTIONS = Object.freeze([
+  Object.freeze({ value: SEASON_FILTER_ALL, label: "試合記録全体" }),
+  Object.freeze({ value: SEASON_FILTER_RANK, label: "ランク通算" }),
+]);
 
 let deckAnalysisFilterValue = SEASON_FILTER_ALL;
 let opponentAnalysisFilterValue = SEASON_FILTER_ALL;
@@ -167,20 +221,24 @@ const callPy = (name, ...args) => {
 };
 
 function updateMatchEntryClock() {
-  if (!matchEntryClockEl) {
+  if (!matchEntryClockEl || currentView !== "match-entry") {
     return;
   }
   const now = new Date();
   const hours = String(now.getHours()).padStart(2, "0");
   const minutes = String(now.getMinutes()).padStart(2, "0");
   const seconds = String(now.getSeconds()).padStart(2, "0");
-  matchEntryClockEl.textContent = `${hours}:${minutes}:${seconds}`;
+  const time = `${hours}:${minutes}:${seconds}`;
+  if (matchEntryClockEl.textContent === time) {
+    return;
+  }
+  matchEntryClockEl.textContent = time;
   matchEntryClockEl.setAttribute("datetime", now.toISOString());
   if (matchEntryDateEl) {
     const year = now.getFullYear();
     const month = String(now.getMonth() + 1).padStart(2, "0");
     const day = String(now.getDate()).padStart(2, "0");
-    matchEntryDateEl.textContent = `(${year}/${month}/${day})`;
+    setTextIfChanged(matchEntryDateEl, `(${year}/${month}/${day})`);
   }
 }
 
@@ -192,7 +250,22 @@ function initialiseMatchEntryClock() {
   if (matchEntryClockTimer !== null) {
     return;
   }
-  matchEntryClockTimer = window.setInterval(updateMatchEntryClock, 1000);
+  scheduleMatchEntryClock();
+}
+
+function scheduleMatchEntryClock() {
+  matchEntryClockTimer = window.setTimeout(() => {
+    updateMatchEntryClock();
+    scheduleMatchEntryClock();
+  }, 1000 - (Date.now() % 1000));
+}
+
+function stopMatchEntryClock() {
+  if (matchEntryClockTimer === null) {
+    return;
+  }
+  window.clearTimeout(matchEntryClockTimer);
+  matchEntryClockTimer = null;
 }
 
 function setActiveView(id) {
@@ -208,9 +281,31 @@ function setActiveView(id) {
     currentEl.classList.remove("view--active");
     currentEl.setAttribute("hidden", "");
   }
+  if (currentView === "match-entry") {
+    stopMatchEntryClock();
+  }
   nextEl.classList.add("view--active");
   nextEl.removeAttribute("hidden");
   currentView = id;
+  if (id === "match-entry") {
+    initialiseMatchEntryClock();
+  }
+  if (staleViews.delete(id)) {
+    deferredViewRenderers.get(id)?.();
+  }
+}
+
+function renderWhenVisible(id) {
+  const render = deferredViewRenderers.get(id);
+  if (!render) {
+    return;
+  }
+  if (currentView === id) {
+    staleViews.delete(id);
+    render();
+  } else {
+    staleViews.add(id);
+  }
 }
 
 function navigateTo(id, { pushCurrent = false } = {}) {
@@ -235,26 +330,23 @@ function goBack() {
 }
 
 function registerNavigationHandlers() {
-  document.querySelectorAll("[data-nav-target]").forEach((button) => {
-    button.addEventListener("click", (event) => {
-      const target = event.currentTarget?.dataset.navTarget;
-      if (!target) {
-        return;
-      }
+  document.addEventListener("click", (event) => {
+    const button = event.target.closest?.("[data-nav-target], [data-nav]");
+    if (!button) {
+      return;
+    }
+    const target = button.dataset.navTarget;
+    if (target) {
       viewStack.length = 0;
       setActiveView(target);
-    });
-  });
-
-  document.querySelectorAll("[data-nav]").forEach((button) => {
-    button.addEventListener("click", (event) => {
-      const action = event.currentTarget?.dataset.nav;
-      if (action === "home") {
-        goHome();
-      } else if (action === "back") {
-        goBack();
-      }
-    });
+      return;
+    }
+    const action = button.dataset.nav;
+    if (action === "home") {
+      goHome();
+    } else if (action === "back") {
+      goBack();
+    }
   });
 }
 
@@ -278,7 +370,7 @@ function formatCount(value) {
   if (Number.isNaN(numeric)) {
     return "0";
   }
-  return numeric.toLocaleString("ja-JP");
+  return COUNT_FORMATTER.format(numeric);
 }
 
 function formatPercentage(value) {
@@ -327,6 +419,24 @@ function formatSeasonPeriod(season) {
   if (!season) {
     return "―";
   }
+  const key = [
+    season.start_date,
+    season.start_time,
+    season.end_date,
+    season.end_time,
+  ].join("\n");
+  let period = seasonPeriodCache.get(key);
+  if (period === undefined) {
+    period = buildSeasonPeriod(season);
+    if (seasonPeriodCache.size >= SEASON_PERIOD_CACHE_LIMIT) {
+      seasonPeriodCache.clear();
+    }
+    seasonPeriodCache.set(key, period);
+  }
+  return period;
+}
+
+function buildSeasonPeriod(season) {
   const startDate = season.start_date || "";
   const startTime = season.start_time || "";
   const endDate = season.end_date || "";
@@ -358,12 +468,7 @@ function formatSeasonPeriod(season) {
 }
 
 function resolveSeasonLabel(seasonId) {
-  if (!seasonId || !latestSnapshot?.seasons) {
-    return "";
-  }
-  const season = latestSnapshot.seasons.find(
-    (item) => String(item.id) === String(seasonId)
-  );
+  const season = seasonId ? seasonsById.get(String(seasonId)) : undefined;
   if (!season) {
     return "";
   }
@@ -400,11 +505,34 @@ function setYoutubeStatus(element, flag) {
   element.dataset.tone = status.tone;
 }
 
+function parseTimestamp(value) {
+  if (
+    typeof value === "string" &&
+    value.length === 25 &&
+    value[4] === "-" &&
+    value[7] === "-" &&
+    value[10] === "T" &&
+    value.endsWith("+00:00")
+  ) {
+    return new Date(
+      Date.UTC(
+        Number(value.slice(0, 4)),
+        Number(value.slice(5, 7)) - 1,
+        Number(value.slice(8, 10)),
+        Number(value.slice(11, 13)),
+        Number(value.slice(14, 16)),
+        Number(value.slice(17, 19)),
+      ),
+    );
+  }
+  return new Date(value);
+}
+
 function formatDateTime(value) {
   if (!value) {
     return "-";
   }
-  const date = new Date(value);
+  const date = parseTimestamp(value);
   if (Number.isNaN(date.getTime())) {
     return value;
   }
@@ -417,20 +545,57 @@ function formatDateTime(value) {
   return `${year}/${month}/${day} ${hours}:${minutes}:${seconds}`;
 }
 
+const iconButtonTemplate = (() => {
+  const button = document.createElement("button");
+  button.type = "button";
+  button.className = "icon-button";
+  return button;
+})();
+
+function createIconButton(action, { label = "", text = "🗑️", data = {} } = {}) {
+  const button = iconButtonTemplate.cloneNode(false);
+  button.textContent = text;
+  button.dataset.action = action;
+  Object.assign(button.dataset, data);
+  if (label) {
+    button.setAttribute("aria-label", label);
+  }
+  return button;
+}
+
+function createEmptyRow(colSpan, text) {
+  const row = document.createElement("tr");
+  const cell = document.createElement("td");
+  cell.colSpan = colSpan;
+  cell.className = "data-table__empty";
+  cell.textContent = text;
+  row.appendChild(cell);
+  return row;
+}
+
 function renderMatches(matches) {
-  matchesTableBody.innerHTML = "";
+  const renderKey = JSON.stringify(
+    matches.map((record) => [
+      record.match_no,
+      record.deck_name,
+      record.opponent_deck,
+      record.turn,
+      record.result,
+      record.created_at,
+    ])
+  );
+  if (isRenderCurrent(matchesTableBody, renderKey)) {
+    return;
+  }
 
   if (!matches.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 6;
-    cell.className = "data-table__empty";
-    cell.textContent = "ランク統計対象の対戦がまだ登録されていません。";
-    row.appendChild(cell);
-    matchesTableBody.appendChild(row);
+    matchesTableBody.replaceChildren(
+      createEmptyRow(6, "ランク統計対象の対戦がまだ登録されていません。")
+    );
     return;
   }
 
+  const fragment = document.createDocumentFragment();
   matches.forEach((record, index) => {
     const row = document.createElement("tr");
 
@@ -458,74 +623,86 @@ function renderMatches(matches) {
     createdAtCell.textContent = record.created_at || "-";
     row.appendChild(createdAtCell);
 
-    matchesTableBody.appendChild(row);
+    fragment.appendChild(row);
   });
+  matchesTableBody.replaceChildren(fragment);
+}
+
+const deckRowTemplate = (() => {
+  const row = document.createElement("tr");
+  const actionsCell = document.createElement("td");
+  actionsCell.className = "data-table__actions";
+  actionsCell.appendChild(createIconButton("delete-deck"));
+  row.append(
+    document.createElement("td"),
+    document.createElement("td"),
+    document.createElement("td"),
+    actionsCell
+  );
+  return row;
+})();
+
+function createDeckRow() {
+  const row = deckRowTemplate.cloneNode(true);
+  const [nameCell, descriptionCell, usageCell, actionsCell] = row.cells;
+  const deleteButton = actionsCell.firstElementChild;
+  return { row, nameCell, descriptionCell, usageCell, deleteButton };
 }
 
 function renderDeckTable(decks) {
-  deckTableBody.innerHTML = "";
-
   if (!decks.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 4;
-    cell.className = "data-table__empty";
-    cell.textContent = "まだデータがありません。";
-    row.appendChild(cell);
-    deckTableBody.appendChild(row);
+    deckTableBody.replaceChildren(createEmptyRow(4, "まだデータがありません。"));
     return;
   }
 
-  decks.forEach((deck) => {
-    const row = document.createElement("tr");
-
-    const nameCell = document.createElement("td");
-    nameCell.textContent = deck.name || "(未設定)";
-    row.appendChild(nameCell);
+  while (deckRowPool.length < decks.length) {
+    deckRowPool.push(createDeckRow());
+  }
 
-    const descriptionCell = document.createElement("td");
-    descriptionCell.textContent = deck.description ? deck.description : "―";
-    row.appendChild(descriptionCell);
+  const rows = decks.map((deck, index) => {
+    const entry = deckRowPool[index];
+    setTextIfChanged(entry.nameCell, deck.name || "(未設定)");
+    setTextIfChanged(entry.descriptionCell, deck.description ? deck.description : "―");
+    setTextIfChanged(entry.usageCell, `${formatCount(deck.usage_count)} 回`);
 
-    const usageCell = document.createElement("td");
-    usageCell.textContent = `${formatCount(deck.usage_count)} 回`;
-    row.appendChild(usageCell);
-
-    const actionsCell = document.createElement("td");
-    actionsCell.className = "data-table__actions";
-    const deleteButton = document.createElement("button");
-    deleteButton.type = "button";
-    deleteButton.className = "icon-button";
-    deleteButton.dataset.action = "delete-deck";
-    deleteButton.dataset.deckName = deck.name;
-    deleteButton.setAttribute("aria-label", `${deck.name} を削除`);
-    deleteButton.textContent = "🗑️";
+    const { deleteButton } = entry;
+    if (deleteButton.dataset.deckName !== deck.name) {
+      deleteButton.dataset.deckName = deck.name;
+      deleteButton.setAttribute("aria-label", `${deck.name} を削除`);
+    }
     const deckUsage = Number(deck.usage_count ?? 0);
-    if (!deck.name || deckUsage > 0) {
-      deleteButton.disabled = true;
-      deleteButton.title = deckUsage > 0 ? "使用中のデッキは削除できません" : "削除できません";
+    const deletable = Boolean(deck.name) && !(deckUsage > 0);
+    if (deleteButton.disabled !== !deletable) {
+      deleteButton.disabled = !deletable;
     }
-    actionsCell.appendChild(deleteButton);
-    row.appendChild(actionsCell);
-
-    deckTableBody.appendChild(row);
+    if (deletable) {
+      deleteButton.removeAttribute("title");
+    } else {
+      const title = deckUsage > 0 ? "使用中のデッキは削除できません" : "削除できません";
+      if (deleteButton.title !== title) {
+        deleteButton.title = title;
+      }
+    }
+    return entry.row;
   });
+
+  deckTableBody.replaceChildren(...rows);
 }
 
 function renderOpponentDeckTable(records) {
-  opponentTableBody.innerHTML = "";
+  const renderKey = JSON.stringify(
+    records.map((record) => [record.name, record.usage_count])
+  );
+  if (isRenderCurrent(opponentTableBody, renderKey)) {
+    return;
+  }
 
   if (!records.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 3;
-    cell.className = "data-table__empty";
-    cell.textContent = "まだデータがありません。";
-    row.appendChild(cell);
-    opponentTableBody.appendChild(row);
+    opponentTableBody.replaceChildren(createEmptyRow(3, "まだデータがありません。"));
     return;
   }
 
+  const fragment = document.createDocumentFragment();
   records.forEach((record) => {
     const row = document.createElement("tr");
 
@@ -539,13 +716,10 @@ function renderOpponentDeckTable(records) {
 
     const actionsCell = document.createElement("td");
     actionsCell.className = "data-table__actions";
-    const deleteButton = document.createElement("button");
-    deleteButton.type = "button";
-    deleteButton.className = "icon-button";
-    deleteButton.dataset.action = "delete-opponent";
-    deleteButton.dataset.opponentName = record.name;
-    deleteButton.setAttribute("aria-label", `${record.name} を削除`);
-    deleteButton.textContent = "🗑️";
+    const deleteButton = createIconButton("delete-opponent", {
+      label: `${record.name} を削除`,
+      data: { opponentName: record.name },
+    });
     const usageCount = Number(record.usage_count ?? 0);
     if (!record.name || usageCount > 0) {
       deleteButton.disabled = true;
@@ -554,8 +728,9 @@ function renderOpponentDeckTable(records) {
     actionsCell.appendChild(deleteButton);
     row.appendChild(actionsCell);
 
-    opponentTableBody.appendChild(row);
+    fragment.appendChild(row);
   });
+  opponentTableBody.replaceChildren(fragment);
 }
 
 function renderSeasonTable(records) {
@@ -563,19 +738,27 @@ function renderSeasonTable(records) {
     return;
   }
 
-  seasonTableBody.innerHTML = "";
+  const renderKey = JSON.stringify(
+    records.map((season) => [
+      season.name,
+      season.start_date,
+      season.start_time,
+      season.end_date,
+      season.end_time,
+      season.rank_statistics_target,
+      season.notes,
+    ])
+  );
+  if (isRenderCurrent(seasonTableBody, renderKey)) {
+    return;
+  }
 
   if (!records.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 5;
-    cell.className = "data-table__empty";
-    cell.textContent = "まだデータがありません。";
-    row.appendChild(cell);
-    seasonTableBody.appendChild(row);
+    seasonTableBody.replaceChildren(createEmptyRow(5, "まだデータがありません。"));
     return;
   }
 
+  const fragment = document.createDocumentFragment();
   records.forEach((season) => {
     const row = document.createElement("tr");
 
@@ -597,18 +780,16 @@ function renderSeasonTable(records) {
 
     const actionsCell = document.createElement("td");
     actionsCell.className = "data-table__actions";
-    const deleteButton = document.createElement("button");
-    deleteButton.type = "button";
-    deleteButton.className = "icon-button";
-    deleteButton.dataset.action = "delete-season";
-    deleteButton.dataset.seasonName = season.name;
-    deleteButton.setAttribute("aria-label", `${season.name} を削除`);
-    deleteButton.textContent = "🗑️";
+    const deleteButton = createIconButton("delete-season", {
+      label: `${season.name} を削除`,
+      data: { seasonName: season.name },
+    });
     actionsCell.appendChild(deleteButton);
     row.appendChild(actionsCell);
 
-    seasonTableBody.appendChild(row);
+    fragment.appendChild(row);
   });
+  seasonTableBody.replaceChildren(fragment);
 }
 
 function renderKeywordTable(keywords) {
@@ -616,19 +797,26 @@ function renderKeywordTable(keywords) {
     return;
   }
 
-  keywordTableBody.innerHTML = "";
+  const renderKey = JSON.stringify(
+    keywords.map((keyword) => [
+      keyword.identifier,
+      keyword.name,
+      keyword.description,
+      keyword.usage_count,
+      keyword.is_hidden,
+      keyword.is_protected,
+    ])
+  );
+  if (isRenderCurrent(keywordTableBody, renderKey)) {
+    return;
+  }
 
   if (!keywords.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 6;
-    cell.className = "data-table__empty";
-    cell.textContent = "まだデータがありません。";
-    row.appendChild(cell);
-    keywordTableBody.appendChild(row);
+    keywordTableBody.replaceChildren(createEmptyRow(6, "まだデータがありません。"));
     return;
   }
 
+  const fragment = document.createDocumentFragment();
   keywords.forEach((keyword) => {
     const row = document.createElement("tr");
 
@@ -659,29 +847,23 @@ function renderKeywordTable(keywords) {
 
     const actionsCell = document.createElement("td");
     actionsCell.className = "data-table__actions";
-    const toggleButton = document.createElement("button");
-    toggleButton.type = "button";
-    toggleButton.className = "icon-button";
-    toggleButton.dataset.action = "toggle-keyword-visibility";
-    toggleButton.dataset.keywordId = keyword.identifier;
-    toggleButton.dataset.hidden = keyword.is_hidden ? "1" : "0";
-    toggleButton.dataset.keywordName = keyword.name || "";
-    toggleButton.setAttribute(
-      "aria-label",
-      keyword.is_hidden
+    const toggleButton = createIconButton("toggle-keyword-visibility", {
+      label: keyword.is_hidden
         ? `${keyword.name} を表示する`
-        : `${keyword.name} を非表示にする`
-    );
-    toggleButton.textContent = keyword.is_hidden ? "👁️‍🗗" : "👁️";
+        : `${keyword.name} を非表示にする`,
+      text: keyword.is_hidden ? "👁️‍🗗" : "👁️",
+      data: {
+        keywordId: keyword.identifier,
+        hidden: keyword.is_hidden ? "1" : "0",
+        keywordName: keyword.name || "",
+      },
+    });
     actionsCell.appendChild(toggleButton);
 
-    const deleteButton = document.createElement("button");
-    deleteButton.type = "button";
-    deleteButton.className = "icon-button";
-    deleteButton.dataset.action = "delete-keyword";
-    deleteButton.dataset.keywordId = keyword.identifier;
-    deleteButton.setAttribute("aria-label", `${keyword.name} を削除`);
-    deleteButton.textContent = "🗑️";
+    const deleteButton = createIconButton("delete-keyword", {
+      label: `${keyword.name} を削除`,
+      data: { keywordId: keyword.identifier },
+    });
     const usage = Number(keyword.usage_count ?? 0);
     if (!keyword.identifier || usage > 0 || keyword.is_protected) {
       deleteButton.disabled = true;
@@ -695,8 +877,9 @@ function renderKeywordTable(keywords) {
     actionsCell.appendChild(deleteButton);
     row.appendChild(actionsCell);
 
-    keywordTableBody.appendChild(row);
+    fragment.appendChild(row);
   });
+  keywordTableBody.replaceChildren(fragment);
 }
 
 function renderMatchList(records) {
@@ -704,75 +887,79 @@ function renderMatchList(records) {
     return;
   }
 
-  matchListTableBody.innerHTML = "";
-
+  const token = ++matchListRenderToken;
   if (!records.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 5;
-    cell.className = "data-table__empty";
-    cell.textContent = "まだデータがありません。";
-    row.appendChild(cell);
-    matchListTableBody.appendChild(row);
+    matchListTableBody.replaceChildren(createEmptyRow(5, "まだデータがありません。"));
     return;
   }
 
-  records.forEach((record) => {
-    const row = document.createElement("tr");
-
-    const timestampCell = document.createElement("td");
+  matchListTableBody.replaceChildren(
+    buildMatchListRows(records, 0, MATCH_LIST_CHUNK_SIZE)
+  );
+  let offset = MATCH_LIST_CHUNK_SIZE;
+  const appendNextChunk = () => {
+    if (token !== matchListRenderToken || offset >= records.length) {
+      return;
+    }
+    matchListTableBody.appendChild(
+      buildMatchListRows(records, offset, offset + MATCH_LIST_CHUNK_SIZE)
+    );
+    offset += MATCH_LIST_CHUNK_SIZE;
+    window.requestAnimationFrame(appendNextChunk);
+  };
+  window.requestAnimationFrame(appendNextChunk);
+}
+
+const matchListRowTemplate = (() => {
+  const row = document.createElement("tr");
+  const actionCell = document.createElement("td");
+  actionCell.className = "data-table__actions";
+  const detailButton = document.createElement("button");
+  detailButton.type = "button";
+  detailButton.className = "primary-button table-action-button";
+  detailButton.dataset.action = "view-match-detail";
+  detailButton.textContent = "詳細";
+  actionCell.appendChild(detailButton);
+  const deleteCell = document.createElement("td");
+  deleteCell.className = "data-table__actions";
+  deleteCell.appendChild(createIconButton("delete-match"));
+  row.append(
+    document.createElement("td"),
+    document.createElement("td"),
+    document.createElement("td"),
+    document.createElement("td"),
+    actionCell,
+    deleteCell
+  );
+  return row;
+})();
+
+function buildMatchListRows(records, start, end) {
+  const fragment = document.createDocumentFragment();
+  records.slice(start, end).forEach((record) => {
+    const row = matchListRowTemplate.cloneNode(true);
+    const [timestampCell, deckCell, matchNoCell, resultCell, actionCell, deleteCell] =
+      row.cells;
     timestampCell.textContent = formatDateTime(record.created_at);
-    row.appendChild(timestampCell);
-
-    const deckCell = document.createElement("td");
     deckCell.textContent = record.deck_name || "(未設定)";
-    row.appendChild(deckCell);
-
-    const matchNoCell = document.createElement("td");
     matchNoCell.textContent = record.match_no ? `#${record.match_no}` : "-";
-    row.appendChild(matchNoCell);
-
-    const resultCell = document.createElement("td");
     resultCell.textContent = formatResult(record.result);
-    row.appendChild(resultCell);
 
-    const actionCell = document.createElement("td");
-    actionCell.className = "data-table__actions";
-    const detailButton = document.createElement("button");
-    detailButton.type = "button";
-    detailButton.className = "primary-button table-action-button";
-    detailButton.dataset.action = "view-match-detail";
+    const detailButton = actionCell.firstElementChild;
+    const deleteButton = deleteCell.firstElementChild;
     if (record.id != null) {
+      const identifier = record.match_no ? `#${record.match_no}` : record.id;
       detailButton.dataset.matchId = String(record.id);
-    } else {
-      detailButton.disabled = true;
-    }
-    detailButton.textContent = "詳細";
-    actionCell.appendChild(detailButton);
-    row.appendChild(actionCell);
-
-    const deleteCell = document.createElement("td");
-    deleteCell.className = "data-table__actions";
-    const deleteButton = document.createElement("button");
-    deleteButton.type = "button";
-    deleteButton.className = "icon-button";
-    deleteButton.dataset.action = "delete-match";
-    if (record.id != null) {
       deleteButton.dataset.matchId = String(record.id);
-      const identifier = record.match_no ? `#${record.match_no}` : record.id;
-      deleteButton.setAttribute(
-        "aria-label",
-        `対戦情報 ${identifier} を削除`
-      );
+      deleteButton.setAttribute("aria-label", `対戦情報 ${identifier} を削除`);
     } else {
+      detailButton.disabled = true;
       deleteButton.disabled = true;
     }
-    deleteButton.textContent = "🗑️";
-    deleteCell.appendChild(deleteButton);
-    row.appendChild(deleteCell);
 
-    matchListTableBody.appendChild(row);
+    fragment.appendChild(row);
   });
+  return fragment;
 }
 
 function renderAnalysisSummary(container, data) {
@@ -813,96 +1000,53 @@ function renderAnalysisSummary(container, data) {
   `;
 }
 
-function renderDeckAnalysisTable(data) {
-  if (!deckAnalysisTableBody) {
+function renderAnalysisTable(tableBody, data) {
+  if (!tableBody) {
     return;
   }
 
-  deckAnalysisTableBody.innerHTML = "";
-
   if (!data.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 7;
-    cell.className = "data-table__empty";
-    cell.textContent = "データがありません。";
-    row.appendChild(cell);
-    deckAnalysisTableBody.appendChild(row);
+    tableBody.replaceChildren(createEmptyRow(7, "データがありません。"));
     return;
   }
 
+  const fragment = document.createDocumentFragment();
   data.forEach((item) => {
     const row = document.createElement("tr");
-    const columns = [
-      item.label,
-      formatCount(item.matchCount),
-      formatCount(item.wins),
-      formatCount(item.losses),
-      formatCount(item.draws),
-      formatPercentage(item.winRate),
-      formatScore(item.avgScore),
-    ];
-    columns.forEach((value) => {
-      const cell = document.createElement("td");
-      cell.textContent = value;
-      row.appendChild(cell);
-    });
-    deckAnalysisTableBody.appendChild(row);
+    row.append(
+      ...[
+        item.label,
+        formatCount(item.matchCount),
+        formatCount(item.wins),
+        formatCount(item.losses),
+        formatCount(item.draws),
+        formatPercentage(item.winRate),
+        formatScore(item.avgScore),
+      ].map((value) => {
+        const cell = document.createElement("td");
+        cell.textContent = value;
+        return cell;
+      })
+    );
+    fragment.appendChild(row);
   });
+  tableBody.replaceChildren(fragment);
 }
 
-function renderOpponentAnalysisTable(data) {
-  if (!opponentAnalysisTableBody) {
-    return;
-  }
-
-  opponentAnalysisTableBody.innerHTML = "";
-
-  if (!data.length) {
-    const row = document.createElement("tr");
-    const cell = document.createElement("td");
-    cell.colSpan = 7;
-    cell.className = "data-table__empty";
-    cell.textContent = "データがありません。";
-    row.appendChild(cell);
-    opponentAnalysisTableBody.appendChild(row);
-    return;
-  }
+function renderDeckAnalysisTable(data) {
+  renderAnalysisTable(deckAnalysisTableBody, data);
+}
 
-  data.forEach((item) => {
-    const row = document.createElement("tr");
-    const columns = [
-      item.label,
-      formatCount(item.matchCount),
-      formatCount(item.wins),
-      formatCount(item.losses),
-      formatCount(item.draws),
-      formatPercentage(item.winRate),
-      formatScore(item.avgScore),
-    ];
-    columns.forEach((value) => {
-      const cell = document.createElement("td");
-      cell.textContent = value;
-      row.appendChild(cell);
-    });
-    opponentAnalysisTableBody.appendChild(row);
-  });
+function renderOpponentAnalysisTable(data) {
+  renderAnalysisTable(opponentAnalysisTableBody, data);
 }
 
 function renderDeckAnalysisChart(data) {
-  renderComboChart(deckAnalysisChartCanvas, data, {
-    labelKey: "label",
-    countAxisLabel: "試合数",
-    rateAxisLabel: "勝率",
-  });
+  renderComboChart(deckAnalysisChartCanvas, data, ANALYSIS_CHART_OPTIONS);
 }
 
 function renderOpponentAnalysisChart(data) {
-  renderComboChart(opponentAnalysisChartCanvas, data, {
-    labelKey: "label",
-    countAxisLabel: "試合数",
-    rateAxisLabel: "勝率",
-  });
+  renderComboChart(opponentAnalysisChartCanvas, data, ANALYSIS_CHART_OPTIONS);
 }
 
 function renderComboChart(canvas, data, options = {}) {
@@ -920,19 +1064,18 @@ function renderComboChart(canvas, data, options = {}) {
 
   if (!data.length) {
     ctx.fillStyle = "rgba(255, 255, 255, 0.6)";
-    ctx.font = "16px 'Segoe UI', 'BIZ UDPGothic', sans-serif";
+    ctx.font = CHART_FONT_EMPTY;
     ctx.textAlign = "center";
     ctx.textBaseline = "middle";
     ctx.fillText("データがありません", width / 2, height / 2);
     return;
   }
 
-  const leftPad = 64;
-  const rightPad = 48;
-  const topPad = 32;
-  const bottomPad = 72;
+  const { left: leftPad, right: rightPad, top: topPad, bottom: bottomPad } =
+    CHART_PADDING;
   const chartWidth = width - leftPad - rightPad;
   const chartHeight = height - topPad - bottomPad;
+  const baselineY = topPad + chartHeight;
 
   const labelKey = options.labelKey ?? "label";
   const maxCount = Math.max(...data.map((item) => item.matchCount || 0), 1);
@@ -942,30 +1085,33 @@ function renderComboChart(canvas, data, options = {}) {
 
   ctx.strokeStyle = "rgba(255, 255, 255, 0.12)";
   ctx.fillStyle = "rgba(255, 255, 255, 0.6)";
-  ctx.font = "12px 'Segoe UI', 'BIZ UDPGothic', sans-serif";
+  ctx.font = CHART_FONT_LABEL;
   ctx.textAlign = "right";
   ctx.textBaseline = "middle";
 
+  ctx.beginPath();
   for (let i = 0; i <= 5; i += 1) {
     const value = countStep * i;
-    const y = topPad + chartHeight - value * countScale;
-    ctx.beginPath();
+    const y = baselineY - value * countScale;
     ctx.moveTo(leftPad, y);
     ctx.lineTo(width - rightPad, y);
-    ctx.stroke();
     ctx.fillText(String(value), leftPad - 8, y);
   }
+  ctx.stroke();
 
   ctx.textAlign = "left";
   for (let i = 0; i <= 4; i += 1) {
     const ratio = i / 4;
-    const y = topPad + chartHeight - ratio * chartHeight;
+    const y = baselineY - ratio * chartHeight;
     ctx.fillText(`${Math.round(ratio * 100)}%`, width - rightPad + 8, y);
   }
 
   const barSpace = chartWidth / data.length;
   const barWidth = Math.min(40, Math.max(18, barSpace * 0.5));
   const barOffset = (barSpace - barWidth) / 2;
+  const halfBarWidth = barWidth / 2;
+  const barCenterOffset = leftPad + barOffset + halfBarWidth;
+  const labelY = height - bottomPad + 12;
 
   const barColor = options.barColor ?? "rgba(79, 141, 209, 0.72)";
   const lineColor = options.lineColor ?? "#f6c945";
@@ -974,28 +1120,27 @@ function renderComboChart(canvas, data, options = {}) {
   ctx.textAlign = "center";
   ctx.textBaseline = "alphabetic";
   ctx.fillStyle = "rgba(255, 255, 255, 0.8)";
-  ctx.font = "12px 'Segoe UI', 'BIZ UDPGothic', sans-serif";
+  ctx.font = CHART_FONT_LABEL;
 
   data.forEach((item, index) => {
-    const x = leftPad + index * barSpace + barOffset;
+    const centerX = barCenterOffset + index * barSpace;
     const count = item.matchCount || 0;
     const barHeight = count * countScale;
-    const y = topPad + chartHeight - barHeight;
+    const y = baselineY - barHeight;
 
     ctx.fillStyle = barColor;
-    ctx.fillRect(x, y, barWidth, barHeight);
+    ctx.fillRect(centerX - halfBarWidth, y, barWidth, barHeight);
 
     ctx.fillStyle = "rgba(255, 255, 255, 0.85)";
-    ctx.fillText(String(count), x + barWidth / 2, y - 6);
+    ctx.fillText(String(count), centerX, y - 6);
 
     const rate = Math.max(0, Math.min(1, Number(item.winRate ?? 0)));
-    const rateY = topPad + chartHeight - rate * chartHeight;
-    points.push({ x: x + barWidth / 2, y: rateY, rate });
+    points.push({ x: centerX, y: baselineY - rate * chartHeight, rate });
 
     const label = String(item[labelKey] ?? "-");
     ctx.save();
-    ctx.translate(x + barWidth / 2, height - bottomPad + 12);
-    ctx.rotate((-45 * Math.PI) / 180);
+    ctx.translate(centerX, labelY);
+    ctx.rotate(CHART_LABEL_ROTATION);
     ctx.textAlign = "right";
     ctx.textBaseline = "middle";
     ctx.fillStyle = "rgba(255, 255, 255, 0.85)";
@@ -1016,17 +1161,20 @@ function renderComboChart(canvas, data, options = {}) {
   ctx.stroke();
 
   ctx.fillStyle = lineColor;
+  ctx.beginPath();
+  points.forEach((point) => {
+    ctx.moveTo(point.x + 3, point.y);
+    ctx.arc(point.x, point.y, 3, 0, CHART_FULL_ARC);
+  });
+  ctx.fill();
+  ctx.font = CHART_FONT_POINT;
+  ctx.textAlign = "center";
+  ctx.textBaseline = "bottom";
   points.forEach((point) => {
-    ctx.beginPath();
-    ctx.arc(point.x, point.y, 3, 0, Math.PI * 2);
-    ctx.fill();
-    ctx.font = "11px 'Segoe UI', 'BIZ UDPGothic', sans-serif";
-    ctx.textAlign = "center";
-    ctx.textBaseline = "bottom";
     ctx.fillText(formatPercentage(point.rate), point.x, point.y - 6);
   });
 
-  ctx.font = "12px 'Segoe UI', 'BIZ UDPGothic', sans-serif";
+  ctx.font = CHART_FONT_LABEL;
   ctx.fillStyle = "rgba(255, 255, 255, 0.78)";
   ctx.textAlign = "left";
   ctx.textBaseline = "bottom";
@@ -1053,11 +1201,6 @@ function populateAnalysisFilters(seasons = []) {
     records
   );
 
-  const baseOptions = [
-    { value: SEASON_FILTER_ALL, label: "試合記録全体" },
-    { value: SEASON_FILTER_RANK, label: "ランク通算" },
-  ];
-
   const seasonOptions = records.map((season) => {
     const labelParts = [season.name || "未設定"];
     const period = formatSeasonPeriod(season);
@@ -1070,14 +1213,14 @@ function populateAnalysisFilters(seasons = []) {
     };
   });
 
-  const options = [...baseOptions, ...seasonOptions];
+  const options = [...ANALYSIS_BASE_FILTER_OPTIONS, ...seasonOptions];
 
   const fill = (select, selected) => {
     if (!select) {
       return;
     }
     const current = ensureValidSeasonFilter(selected ?? SEASON_FILTER_ALL, records);
-    select.innerHTML = "";
+    const fragment = document.createDocumentFragment();
     options.forEach((option) => {
       const optionEl = document.createElement("option");
       optionEl.value = option.value;
@@ -1085,8 +1228,9 @@ function populateAnalysisFilters(seasons = []) {
       if (option.value === current) {
         optionEl.selected = true;
       }
-      select.appendChild(optionEl);
+      fragment.appendChild(optionEl);
     });
+    select.replaceChildren(fragment);
     return current;
   };
 
@@ -1121,66 +1265,23 @@ function filterMatchesForAnalysis(matches, filterValue) {
   });
 }
 
-function buildDeckAnalysisData(matches) {
-  const buckets = new Map();
-  (matches || []).forEach((match) => {
-    const label = match?.deck_name ? String(match.deck_name) : "(未設定)";
-    if (!buckets.has(label)) {
-      buckets.set(label, {
-        label,
-        matchCount: 0,
-        wins: 0,
-        losses: 0,
-        draws: 0,
-        scoreSum: 0,
-      });
-    }
-    const bucket = buckets.get(label);
-    bucket.matchCount += 1;
-    const result = Number(match?.result ?? 0);
-    if (result > 0) {
-      bucket.wins += 1;
-    } else if (result < 0) {
-      bucket.losses += 1;
-    } else {
-      bucket.draws += 1;
-    }
-    if (Number.isFinite(result)) {
-      bucket.scoreSum += result;
-    }
-  });
-
-  return Array.from(buckets.values())
-    .map((bucket) => ({
-      ...bucket,
-      winRate: bucket.matchCount ? bucket.wins / bucket.matchCount : 0,
-      avgScore: bucket.matchCount ? bucket.scoreSum / bucket.matchCount : 0,
-    }))
-    .sort((a, b) => {
-      if (b.matchCount !== a.matchCount) {
-        return b.matchCount - a.matchCount;
-      }
-      return a.label.localeCompare(b.label, "ja");
-    });
-}
-
-function buildOpponentAnalysisData(matches) {
+function buildAnalysisData(matches, key) {
   const buckets = new Map();
   (matches || []).forEach((match) => {
-    const label = match?.opponent_deck
-      ? String(match.opponent_deck)
-      : "(未設定)";
-    if (!buckets.has(label)) {
-      buckets.set(label, {
+    const value = match?.[key];
+    const label = value ? String(value) : "(未設定)";
+    let bucket = buckets.get(label);
+    if (!bucket) {
+      bucket = {
         label,
         matchCount: 0,
         wins: 0,
         losses: 0,
         draws: 0,
         scoreSum: 0,
-      });
+      };
+      buckets.set(label, bucket);
     }
-    const bucket = buckets.get(label);
     bucket.matchCount += 1;
     const result = Number(match?.result ?? 0);
     if (result > 0) {
@@ -1212,7 +1313,7 @@ function buildOpponentAnalysisData(matches) {
 function updateDeckAnalysisView() {
   const matches = latestSnapshot?.matches ?? [];
   const filtered = filterMatchesForAnalysis(matches, deckAnalysisFilterValue);
-  deckAnalysisData = buildDeckAnalysisData(filtered);
+  deckAnalysisData = buildAnalysisData(filtered, "deck_name");
   renderAnalysisSummary(deckAnalysisSummaryEl, deckAnalysisData);
   renderDeckAnalysisTable(deckAnalysisData);
   renderDeckAnalysisChart(deckAnalysisData);
@@ -1221,7 +1322,7 @@ function updateDeckAnalysisView() {
 function updateOpponentAnalysisView() {
   const matches = latestSnapshot?.matches ?? [];
   const filtered = filterMatchesForAnalysis(matches, opponentAnalysisFilterValue);
-  opponentAnalysisData = buildOpponentAnalysisData(filtered);
+  opponentAnalysisData = buildAnalysisData(filtered, "opponent_deck");
   renderAnalysisSummary(opponentAnalysisSummaryEl, opponentAnalysisData);
   renderOpponentAnalysisTable(opponentAnalysisData);
   renderOpponentAnalysisChart(opponentAnalysisData);
@@ -1243,11 +1344,9 @@ function renderMatchDetail(detail) {
     matchDetailTurnEl.textContent = "-";
     matchDetailOpponentEl.textContent = "-";
     if (matchDetailKeywordsEl) {
-      matchDetailKeywordsEl.innerHTML = "";
       matchDetailKeywordsEl.textContent = "-";
     }
     if (matchDetailMemoEl) {
-      matchDetailMemoEl.innerHTML = "";
       matchDetailMemoEl.textContent = "-";
     }
     if (matchDetailYoutubeStatusEl) {
@@ -1293,36 +1392,28 @@ function renderMatchDetail(detail) {
   matchDetailOpponentEl.textContent = detail.opponent_deck || "-";
 
   if (matchDetailKeywordsEl) {
-    matchDetailKeywordsEl.innerHTML = "";
+    const fragment = document.createDocumentFragment();
     if (detail.keyword_details && detail.keyword_details.length) {
       detail.keyword_details.forEach((keyword) => {
         const chip = document.createElement("span");
         chip.className = "keyword-chip";
         chip.textContent = keyword.name;
-        matchDetailKeywordsEl.appendChild(chip);
+        fragment.appendChild(chip);
       });
     } else {
       const placeholder = document.createElement("span");
       placeholder.className = "keyword-chip";
       placeholder.dataset.empty = "true";
       placeholder.textContent = "未設定";
-      matchDetailKeywordsEl.appendChild(placeholder);
+      fragment.appendChild(placeholder);
     }
+    matchDetailKeywordsEl.replaceChildren(fragment);
   }
 
   if (matchDetailMemoEl) {
-    matchDetailMemoEl.innerHTML = "";
-    if (detail.memo) {
-      const lines = String(detail.memo).split(/\r?\n/);
-      lines.forEach((line, index) => {
-        if (index > 0) {
-          matchDetailMemoEl.appendChild(document.createElement("br"));
-        }
-        matchDetailMemoEl.appendChild(document.createTextNode(line));
-      });
-    } else {
-      matchDetailMemoEl.textContent = "―";
-    }
+    matchDetailMemoEl.textContent = detail.memo
+      ? String(detail.memo).replace(/\r\n/g, "\n")
+      : "―";
   }
 
   if (matchDetailYoutubeStatusEl) {
@@ -1434,6 +1525,7 @@ function fillMatchEditForm(detail) {
 
   populateOpponentOptions(latestSnapshot?.opponent_decks ?? [], {
     select: matchEditOpponentSelect,
+    input: null,
     selectedValue: detail.opponent_deck || "",
   });
 
@@ -1443,15 +1535,13 @@ function fillMatchEditForm(detail) {
       : [],
   });
 
-  const turnInputs = matchEditForm.querySelectorAll('input[name="turn"]');
-  turnInputs.forEach((input) => {
-    input.checked = input.value === (detail.turn ? "first" : "second");
-  });
+  if (matchEditTurnInputs) {
+    matchEditTurnInputs.value = detail.turn ? "first" : "second";
+  }
 
-  const resultInputs = matchEditForm.querySelectorAll('input[name="result"]');
-  resultInputs.forEach((input) => {
-    input.checked = input.value === String(detail.result ?? "");
-  });
+  if (matchEditResultInputs) {
+    matchEditResultInputs.value = String(detail.result ?? "");
+  }
 
   if (matchEditYoutubeInput) {
     matchEditYoutubeInput.value = detail.youtube_url || "";
@@ -1499,55 +1589,71 @@ function populateDeckOptions(decks, options = {}) {
   }
 }
 
+const renderKeys = new WeakMap();
+
+function isRenderCurrent(element, key) {
+  if (renderKeys.get(element) === key) {
+    return true;
+  }
+  renderKeys.set(element, key);
+  return false;
+}
+
 function populateOpponentOptions(records, options = {}) {
-  const selectElement = options.select ?? matchEditOpponentSelect;
-  const inputElement = options.input ?? matchOpponentInput;
-  const listElement = options.list ?? matchOpponentList;
+  const selectElement =
+    options.select !== undefined ? options.select : matchEditOpponentSelect;
+  const inputElement =
+    options.input !== undefined ? options.input : matchOpponentInput;
+  const listElement = options.list !== undefined ? options.list : matchOpponentList;
   const selectedValue = options.selectedValue ?? (
     selectElement ? selectElement.value ?? "" : inputElement?.value ?? ""
   );
+  const labels = records.map((record) =>
+    Number(record.usage_count ?? 0)
+      ? `${record.name}（${formatCount(record.usage_count)}回）`
+      : record.name
+  );
+  const listKey = JSON.stringify([records.map((record) => record.name), labels]);
 
   if (selectElement) {
     const current = selectedValue ?? selectElement.value ?? "";
-    selectElement.innerHTML = "";
-
-    const placeholder = document.createElement("option");
-    placeholder.value = "";
-    placeholder.textContent = "対戦相手デッキを選択...";
-    let matched = false;
-    selectElement.appendChild(placeholder);
+    const matched = Boolean(current) && records.some((record) => record.name === current);
 
-    records.forEach((record) => {
-      const option = document.createElement("option");
-      option.value = record.name;
-      const usage = Number(record.usage_count ?? 0);
-      option.textContent = usage
-        ? `${record.name}（${formatCount(record.usage_count)}回）`
-        : record.name;
-      if (record.name === current) {
-        option.selected = true;
-        matched = true;
-      }
-      selectElement.appendChild(option);
-    });
-
-    if (!current || !matched) {
-      placeholder.selected = true;
+    if (isRenderCurrent(selectElement, listKey)) {
+      selectElement.value = matched ? current : "";
+    } else {
+      const placeholder = document.createElement("option");
+      placeholder.value = "";
+      placeholder.textContent = "対戦相手デッキを選択...";
+      placeholder.selected = !matched;
+      const fragment = document.createDocumentFragment();
+      fragment.appendChild(placeholder);
+
+      records.forEach((record, index) => {
+        const option = document.createElement("option");
+        option.value = record.name;
+        option.textContent = labels[index];
+        if (matched && record.name === current) {
+          option.selected = true;
+        }
+        fragment.appendChild(option);
+      });
+      selectElement.replaceChildren(fragment);
     }
   }
 
   if (inputElement && listElement) {
     const existingValue = options.selectedValue ?? inputElement.value ?? "";
-    listElement.innerHTML = "";
-    records.forEach((record) => {
-      const option = document.createElement("option");
-      option.value = record.name;
-      const usage = Number(record.usage_count ?? 0);
-      option.label = usage
-        ? `${record.name}（${formatCount(record.usage_count)}回）`
-        : record.name;
-      listElement.appendChild(option);
-    });
+    if (!isRenderCurrent(listElement, listKey)) {
+      const fragment = document.createDocumentFragment();
+      records.forEach((record, index) => {
+        const option = document.createElement("option");
+        option.value = record.name;
+        option.label = labels[index];
+        fragment.appendChild(option);
+      });
+      listElement.replaceChildren(fragment);
+    }
     if (existingValue) {
       inputElement.value = existingValue;
     }
@@ -1556,7 +1662,8 @@ function populateOpponentOptions(records, options = {}) {
 
 function populateSeasonOptions(seasons, options = {}) {
   const startSelect = options.startSelect ?? matchStartSeasonSelect;
-  const editSelect = options.editSelect ?? matchEditSeasonSelect;
+  const editSelect =
+    options.editSelect !== undefined ? options.editSelect : matchEditSeasonSelect;
   const startValue =
     options.startValue ?? (startSelect ? startSelect.value ?? "" : "");
   const editValue = options.editValue ?? (editSelect ? editSelect.value ?? "" : "");
@@ -1565,13 +1672,15 @@ function populateSeasonOptions(seasons, options = {}) {
     if (!select) {
       return;
     }
-    const current = selected ?? "";
-    select.innerHTML = "";
+    const current = String(selected ?? "");
+    const matched =
+      Boolean(current) && seasons.some((season) => String(season.id) === current);
     const placeholder = document.createElement("option");
     placeholder.value = "";
     placeholder.textContent = "シーズンを選択...";
-    placeholder.selected = !current;
-    select.appendChild(placeholder);
+    placeholder.selected = !matched;
+    const fragment = document.createDocumentFragment();
+    fragment.appendChild(placeholder);
 
     seasons.forEach((season) => {
       const option = document.createElement("option");
@@ -1580,21 +1689,26 @@ function populateSeasonOptions(seasons, options = {}) {
       option.textContent = period && period !== "―"
         ? `${season.name}（${period}）`
         : season.name;
-      if (String(season.id) === String(current)) {
+      if (matched && option.value === current) {
         option.selected = true;
       }
-      select.appendChild(option);
+      fragment.appendChild(option);
     });
 
-    if (current && !Array.from(select.options).some((opt) => opt.value === String(current))) {
-      placeholder.selected = true;
-    }
+    select.replaceChildren(fragment);
   };
 
   fill(startSelect, startValue);
   fill(editSelect, editValue);
 }
 
+const keywordToggleTemplate = (() => {
+  const button = document.createElement("button");
+  button.type = "button";
+  button.className = "keyword-toggle";
+  return button;
+})();
+
 function refreshKeywordToggleList(target, keywords, { selected } = {}) {
   const container =
     target === "entry" ? matchKeywordsContainer : matchEditKeywordsContainer;
@@ -1623,97 +1737,85 @@ function refreshKeywordToggleList(target, keywords, { selected } = {}) {
   });
 
   const keywordList = Array.isArray(keywords) ? keywords : [];
-  const items = keywordList.filter((keyword) => {
-    if (!keyword) {
-      return false;
-    }
-    if (!keyword.is_hidden) {
-      return true;
-    }
-    return state.has(String(keyword.identifier));
-  });
+  const renderKey = JSON.stringify([
+    keywordList.map((keyword) => [keyword?.identifier, keyword?.name, keyword?.is_hidden]),
+    Array.from(state),
+  ]);
+  hiddenInput.value = JSON.stringify(Array.from(state));
+  if (keywordToggleKeys[target] === renderKey) {
+    return;
+  }
+  keywordToggleKeys[target] = renderKey;
 
-  const uniqueItems = [];
   const seen = new Set();
-  items.forEach((keyword) => {
-    const id = String(keyword.identifier);
-    if (!seen.has(id)) {
-      uniqueItems.push(keyword);
-      seen.add(id);
+  const fragment = document.createDocumentFragment();
+  keywordList.forEach((keyword) => {
+    if (!keyword) {
+      return;
     }
-  });
-
-  container.innerHTML = "";
-  uniqueItems.forEach((keyword) => {
     const id = String(keyword.identifier);
-    const button = document.createElement("button");
-    button.type = "button";
-    button.className = "keyword-toggle";
+    const selectedNow = state.has(id);
+    if ((keyword.is_hidden && !selectedNow) || seen.has(id)) {
+      return;
+    }
+    seen.add(id);
+    const button = keywordToggleTemplate.cloneNode(false);
     if (keyword.is_hidden) {
       button.classList.add("keyword-toggle--hidden");
       button.title = "非表示のキーワードです";
     }
     button.dataset.keywordId = id;
-    const selectedNow = state.has(id);
     button.setAttribute("aria-pressed", selectedNow ? "true" : "false");
     button.textContent = keyword.name;
-    button.addEventListener("click", () => {
-      const pressed = button.getAttribute("aria-pressed") === "true";
-      if (pressed) {
-        state.delete(id);
-        button.setAttribute("aria-pressed", "false");
-        if (keyword.is_hidden && target === "entry") {
-          button.remove();
-        }
-      } else {
-        state.add(id);
-        button.setAttribute("aria-pressed", "true");
-      }
-      hiddenInput.value = JSON.stringify(Array.from(state));
-    });
-    container.appendChild(button);
+    fragment.appendChild(button);
   });
+  container.replaceChildren(fragment);
+}
 
+function toggleKeywordButton(event) {
+  const target = event.currentTarget === matchKeywordsContainer ? "entry" : "edit";
+  const button = event.target.closest(".keyword-toggle");
+  const hiddenInput =
+    target === "entry" ? matchKeywordsInput : matchEditKeywordsInput;
+  const state = keywordToggleState[target];
+  if (!button || !hiddenInput || !state) {
+    return;
+  }
+  const id = button.dataset.keywordId;
+  keywordToggleKeys[target] = null;
+  if (button.getAttribute("aria-pressed") === "true") {
+    state.delete(id);
+    button.setAttribute("aria-pressed", "false");
+    if (target === "entry" && button.classList.contains("keyword-toggle--hidden")) {
+      button.remove();
+    }
+  } else {
+    state.add(id);
+    button.setAttribute("aria-pressed", "true");
+  }
   hiddenInput.value = JSON.stringify(Array.from(state));
 }
 
 function updateMatchEntryView() {
-  matchEntryDeckNameEl.textContent = matchEntryState.deckName || "-";
-  matchEntryNumberEl.textContent =
-    matchEntryState.matchNumber !== null ? matchEntryState.matchNumber : "-";
+  setTextIfChanged(matchEntryDeckNameEl, matchEntryState.deckName || "-");
+  setTextIfChanged(
+    matchEntryNumberEl,
+    matchEntryState.matchNumber !== null ? matchEntryState.matchNumber : "-"
+  );
   matchEntryForm.reset();
-  if (matchEntryMemoInput) {
-    matchEntryMemoInput.value = "";
-  }
-  if (matchKeywordsInput) {
+  if (matchKeywordsInput && matchKeywordsInput.value !== "[]") {
     matchKeywordsInput.value = "[]";
   }
   keywordToggleState.entry.clear();
   const seasonLabel =
     resolveSeasonLabel(matchEntryState.seasonId) || matchEntryState.seasonName || "―";
   if (matchEntrySeasonEl) {
-    matchEntrySeasonEl.textContent = seasonLabel;
+    setTextIfChanged(matchEntrySeasonEl, seasonLabel);
   }
-  populateOpponentOptions(latestSnapshot?.opponent_decks ?? [], {
-    input: matchOpponentInput,
-    list: matchOpponentList,
-    selectedValue: "",
-  });
   refreshKeywordToggleList("entry", latestSnapshot?.keywords ?? [], { selected: [] });
 }
 
-function applyRecordingSnapshot(recording) {
-  recordingState = recording || null;
-
-  if (!recording) {
-    if (recordingStatusLabel) {
-      recordingStatusLabel.textContent = "状態：未取得";
-    }
-    return;
-  }
-
-  const settings = recording.settings ?? {};
-
+function applyRecordingSettingsInputs(settings) {
   if (recordingSaveDirectoryInput) {
     recordingSaveDirectoryInput.value = settings.save_directory ?? "";
   }
@@ -1741,13 +1843,32 @@ function applyRecordingSnapshot(recording) {
   if (recordingVideoSourceInput) {
     recordingVideoSourceInput.value = settings.video_source ?? "";
   }
+}
+
+function applyRecordingSnapshot(recording) {
+  recordingState = recording || null;
+
+  if (!recording) {
+    if (recordingStatusLabel) {
+      setTextIfChanged(recordingStatusLabel, "状態：未取得");
+    }
+    return;
+  }
+
+  const settings = recording.settings ?? {};
+  const settingsKey = JSON.stringify(settings);
+  if (settingsKey !== appliedRecordingSettingsKey) {
+    appliedRecordingSettingsKey = settingsKey;
+    applyRecordingSettingsInputs(settings);
+  }
 
   if (recordingStatusLabel) {
     const statusText = recording.is_recording ? "録画中" : "待機";
     const profileLabel = recording.active_profile || settings.profile || "";
-    recordingStatusLabel.textContent = profileLabel
-      ? `状態：${statusText}（${profileLabel}）`
-      : `状態：${statusText}`;
+    setTextIfChanged(
+      recordingStatusLabel,
+      profileLabel ? `状態：${statusText}（${profileLabel}）` : `状態：${statusText}`
+    );
   }
 
   if (recordingStartButton) {
@@ -1761,103 +1882,112 @@ function applyRecordingSnapshot(recording) {
     const lastRecording = recording.last_recording;
     if (lastRecording && lastRecording.path) {
       const status = lastRecording.status ? `（${lastRecording.status}）` : "";
-      recordingLastOutputEl.textContent = `${lastRecording.path}${status}`;
+      setTextIfChanged(recordingLastOutputEl, `${lastRecording.path}${status}`);
     } else {
-      recordingLastOutputEl.textContent = "―";
+      setTextIfChanged(recordingLastOutputEl, "―");
     }
   }
 
   if (recordingLastScreenshotEl) {
-    recordingLastScreenshotEl.textContent = recording.last_screenshot || "―";
+    setTextIfChanged(recordingLastScreenshotEl, recording.last_screenshot || "―");
+  }
+}
+
+function setTextIfChanged(element, value) {
+  const text = String(value);
+  if (element.textContent !== text) {
+    element.textContent = text;
   }
 }
 
+function sortMatchesNewestFirst(matches) {
+  return matches
+    .map((match) => ({ match, time: Date.parse(match.created_at ?? "") }))
+    .sort((a, b) => {
+      if (Number.isNaN(a.time) || Number.isNaN(b.time)) {
+        return (b.match.id ?? 0) - (a.match.id ?? 0);
+      }
+      if (a.time === b.time) {
+        return (b.match.match_no ?? 0) - (a.match.match_no ?? 0);
+      }
+      return b.time - a.time;
+    })
+    .map(({ match }) => match);
+}
+
 function applySnapshot(snapshot) {
   latestSnapshot = snapshot;
-  versionEl.textContent = snapshot.version ?? "DPL";
-  migrationEl.textContent = snapshot.migration_result?.trim()
-    ? snapshot.migration_result
-    : "特記事項なし";
+  setTextIfChanged(versionEl, snapshot.version ?? "DPL");
+  setTextIfChanged(
+    migrationEl,
+    snapshot.migration_result?.trim() ? snapshot.migration_result : "特記事項なし"
+  );
 
-  deckCountEl.textContent = snapshot.decks?.length ?? 0;
-  seasonCountEl.textContent = snapshot.seasons?.length ?? 0;
-  matchCountEl.textContent = snapshot.matches?.length ?? 0;
+  setTextIfChanged(deckCountEl, snapshot.decks?.length ?? 0);
+  setTextIfChanged(seasonCountEl, snapshot.seasons?.length ?? 0);
+  setTextIfChanged(matchCountEl, snapshot.matches?.length ?? 0);
 
-  const records = snapshot.matches ? [...snapshot.matches] : [];
-  records.sort((a, b) => {
-    if (a.created_at === b.created_at) {
-      return (a.match_no ?? 0) - (b.match_no ?? 0);
-    }
-    return a.created_at > b.created_at ? 1 : -1;
-  });
-  const rankMatches = records.filter((record) =>
+  const matchRecords = sortMatchesNewestFirst(snapshot.matches ?? []);
+  const rankMatches = matchRecords.filter((record) =>
     Boolean(record.rank_statistics_target)
   );
-  renderMatches(rankMatches.slice(-10).reverse());
+  renderMatches(rankMatches.slice(0, 10));
+  latestMatchRecords = matchRecords;
 
   const deckRecords = snapshot.decks ? [...snapshot.decks] : [];
-  renderDeckTable(deckRecords);
+  renderWhenVisible("deck-registration");
   populateDeckOptions(deckRecords);
 
   const opponentRecords = snapshot.opponent_decks
     ? [...snapshot.opponent_decks]
     : [];
-  renderOpponentDeckTable(opponentRecords);
-  populateOpponentOptions(opponentRecords, {
-    input: matchOpponentInput,
-    list: matchOpponentList,
-    selectedValue: matchOpponentInput?.value ?? "",
-  });
-  populateOpponentOptions(opponentRecords, {
-    select: matchEditOpponentSelect,
-    selectedValue:
-      matchEditOpponentSelect?.value || currentMatchDetail?.opponent_deck || "",
-  });
+  renderWhenVisible("opponent-deck-registration");
+  renderWhenVisible("match-entry");
+  const editing = currentView === "match-edit";
+  if (editing) {
+    populateOpponentOptions(opponentRecords, {
+      select: matchEditOpponentSelect,
+      input: null,
+      selectedValue:
+        matchEditOpponentSelect?.value || currentMatchDetail?.opponent_deck || "",
+    });
+  }
 
   const keywordRecords = snapshot.keywords ? [...snapshot.keywords] : [];
-  renderKeywordTable(keywordRecords);
+  renderWhenVisible("keyword-management");
   refreshKeywordToggleList("entry", keywordRecords, {
     selected: Array.from(keywordToggleState.entry),
   });
-  const editSelection =
-    currentView === "match-edit"
-      ? Array.from(keywordToggleState.edit)
-      : [];
-  refreshKeywordToggleList("edit", keywordRecords, { selected: editSelection });
+  if (editing) {
+    refreshKeywordToggleList("edit", keywordRecords, {
+      selected: Array.from(keywordToggleState.edit),
+    });
+  }
 
   const seasonRecords = snapshot.seasons ? [...snapshot.seasons] : [];
-  renderSeasonTable(seasonRecords);
+  seasonsById = new Map(seasonRecords.map((season) => [String(season.id), season]));
+  renderWhenVisible("season-registration");
   populateSeasonOptions(seasonRecords, {
     startSelect: matchStartSeasonSelect,
     startValue:
       matchStartSeasonSelect?.value || (matchEntryState.seasonId ? String(matchEntryState.seasonId) : ""),
-    editSelect: matchEditSeasonSelect,
+    editSelect: editing ? matchEditSeasonSelect : null,
     editValue:
       matchEditSeasonSelect?.value || (currentMatchDetail?.season_id ? String(currentMatchDetail.season_id) : ""),
   });
 
-  populateDeckOptions(deckRecords, {
-    select: matchEditDeckSelect,
-    selectedValue: matchEditDeckSelect?.value || currentMatchDetail?.deck_name || "",
-  });
+  if (editing) {
+    populateDeckOptions(deckRecords, {
+      select: matchEditDeckSelect,
+      selectedValue: matchEditDeckSelect?.value || currentMatchDetail?.deck_name || "",
+    });
+  }
 
   populateAnalysisFilters(seasonRecords);
-  updateDeckAnalysisView();
-  updateOpponentAnalysisView();
+  renderWhenVisible("deck-analysis");
+  renderWhenVisible("opponent-analysis");
 
-  const matchRecords = snapshot.matches ? [...snapshot.matches] : [];
-  matchRecords.sort((a, b) => {
-    const timeA = Date.parse(a.created_at ?? "");
-    const timeB = Date.parse(b.created_at ?? "");
-    if (Number.isNaN(timeA) || Number.isNaN(timeB)) {
-      return (b.id ?? 0) - (a.id ?? 0);
-    }
-    if (timeA === timeB) {
-      return (b.match_no ?? 0) - (a.match_no ?? 0);
-    }
-    return timeB - timeA;
-  });
-  renderMatchList(matchRecords);
+  renderWhenVisible("match-list");
 
   if (currentMatchDetail?.id && currentView === "match-detail") {
     showMatchDetail(currentMatchDetail.id, { pushHistory: false, navigate: false });
@@ -1944,9 +2074,9 @@ function handleOperationResponse(response, successMessage) {
   return true;
 }
 
-async function fetchSnapshot({ silent = false } = {}) {
+async function fetchSnapshot({ silent = false, refresh = true } = {}) {
   try {
-    const snapshot = await callPy("fetch_snapshot");
+    const snapshot = await callPy("fetch_snapshot", refresh);
     applySnapshot(snapshot);
     if (!silent) {
       showNotification("最新のデータを読み込みました");
@@ -2063,6 +2193,14 @@ if (keywordForm) {
   });
 }
 
+if (matchKeywordsContainer) {
+  matchKeywordsContainer.addEventListener("click", toggleKeywordButton);
+}
+
+if (matchEditKeywordsContainer) {
+  matchEditKeywordsContainer.addEventListener("click", toggleKeywordButton);
+}
+
 if (deckTableBody) {
   deckTableBody.addEventListener("click", async (event) => {
     const button = event.target.closest("[data-action='delete-deck']");
@@ -2268,30 +2406,33 @@ matchStartForm.addEventListener("submit", async (event) => {
   });
 });
 
-if (deckAnalysisFilter) {
-  deckAnalysisFilter.addEventListener("change", (event) => {
-    const value = event.target?.value ?? SEASON_FILTER_ALL;
-    deckAnalysisFilterValue = ensureValidSeasonFilter(
-      value,
-      latestSnapshot?.seasons ?? []
-    );
+function handleAnalysisFilterChange(event) {
+  const value = ensureValidSeasonFilter(
+    event.target?.value ?? SEASON_FILTER_ALL,
+    latestSnapshot?.seasons ?? []
+  );
+  if (event.currentTarget === deckAnalysisFilter) {
+    deckAnalysisFilterValue = value;
     updateDeckAnalysisView();
-  });
+  } else {
+    opponentAnalysisFilterValue = value;
+    updateOpponentAnalysisView();
+  }
+}
+
+if (deckAnalysisFilter) {
+  deckAnalysisFilter.addEventListener("change", handleAnalysisFilterChange);
 }
 
 if (opponentAnalysisFilter) {
-  opponentAnalysisFilter.addEventListener("change", (event) => {
-    const value = event.target?.value ?? SEASON_FILTER_ALL;
-    opponentAnalysisFilterValue = ensureValidSeasonFilter(
-      value,
-      latestSnapshot?.seasons ?? []
-    );
-    updateOpponentAnalysisView();
-  });
+  opponentAnalysisFilter.addEventListener("change", handleAnalysisFilterChange);
 }
 
 matchEntryForm.addEventListener("submit", async (event) => {
   event.preventDefault();
+  if (matchEntrySubmitting) {
+    return;
+  }
   if (!matchEntryState.deckName) {
     showNotification("デッキが選択されていません", 3600);
     return;
@@ -2332,6 +2473,11 @@ matchEntryForm.addEventListener("submit", async (event) => {
     payload.season_name = matchEntryState.seasonName;
   }
 
+  const submitButton = event.submitter ?? null;
+  matchEntrySubmitting = true;
+  if (submitButton) {
+    submitButton.disabled = true;
+  }
   try {
     const response = await callPy("register_match", payload);
     if (handleOperationResponse(response, "対戦情報を登録しました")) {
@@ -2343,6 +2489,11 @@ matchEntryForm.addEventListener("submit", async (event) => {
     }
   } catch (error) {
     handleError(error, "対戦情報の登録に失敗しました", { context: "register_match" });
+  } finally {
+    matchEntrySubmitting = false;
+    if (submitButton) {
+      submitButton.disabled = false;
+    }
   }
 });
 
@@ -2389,9 +2540,7 @@ if (matchListTableBody) {
 }
 
 if (matchDetailEditButton) {
-  matchDetailEditButton.addEventListener("click", () => {
-    openMatchEditView();
-  });
+  matchDetailEditButton.addEventListener("click", openMatchEditView);
 }
 
 if (recordingSettingsForm) {
@@ -2855,6 +3004,8 @@ if (matchEditForm) {
 registerNavigationHandlers();
 
 window.addEventListener("DOMContentLoaded", () => {
-  initialiseMatchEntryClock();
-  fetchSnapshot({ silent: true });
+  if (currentView === "match-entry") {
+    initialiseMatchEntryClock();
+  }
+  fetchSnapshot({ silent: true, refresh: false });
 });
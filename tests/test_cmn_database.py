@@ -1,3 +1,4 @@
+import csv
 import json
 import sqlite3
 import sys
@@ -235,3 +236,216 @@ def test_e2e_restart_keeps_data(temp_db: Path) -> None:
     assert deck_names == ["Restart Deck"]
     assert match_results == [-1]
     assert user_version == DatabaseManager.SCHEMA_VERSION
+
+
+def test_record_matches_bulk_insert_updates_usage(temp_db: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+    manager.add_deck("Bulk Deck")
+    keyword_id = manager.add_keyword("Bulk Tag")
+
+    inserted = manager.record_matches(
+        [
+            {
+                "match_no": index,
+                "deck_name": "Bulk Deck",
+                "turn": index % 2 == 0,
+                "result": 1,
+                "opponent_deck": " Rival ",
+                "keywords": [keyword_id],
+            }
+            for index in range(1, 4)
+        ]
+    )
+
+    assert inserted == 3
+    matches = manager.fetch_matches("Bulk Deck")
+    assert sorted(match["match_no"] for match in matches) == [1, 2, 3]
+    assert all(match["keyword_ids"] == [keyword_id] for match in matches)
+    assert manager.fetch_decks()[0]["usage_count"] == 3
+    assert manager.fetch_opponent_decks() == [{"name": "Rival", "usage_count": 3}]
+    keyword = next(
+        item for item in manager.fetch_keywords() if item["identifier"] == keyword_id
+    )
+    assert keyword["usage_count"] == 3
+    assert manager.record_matches([]) == 0
+
+
+def test_record_match_returns_inserted_id(temp_db: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+    manager.add_deck("Id Deck")
+    manager.add_opponent_deck("Existing Rival")
+
+    first_id = manager.record_match(
+        {"match_no": 1, "deck_name": "Id Deck", "turn": True, "result": 1}
+    )
+    second_id = manager.record_match(
+        {
+            "match_no": 2,
+            "deck_name": "Id Deck",
+            "turn": False,
+            "result": -1,
+            "opponent_deck": "New Rival",
+        }
+    )
+
+    assert second_id != first_id
+    assert manager.fetch_match(first_id)["match_no"] == 1
+    detail = manager.fetch_match(second_id)
+    assert detail["match_no"] == 2
+    assert detail["opponent_deck"] == "New Rival"
+    assert manager.fetch_matches()[-1] == detail
+
+
+def test_snapshot_round_trip_restores_database(temp_db: Path, tmp_path: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+    manager.add_deck("Snapshot Deck")
+    manager.record_match(
+        {"match_no": 1, "deck_name": "Snapshot Deck", "turn": True, "result": 1}
+    )
+
+    snapshot = manager.export_snapshot(tmp_path / "snapshots" / "db.sqlite3")
+    assert snapshot.exists()
+
+    manager.add_deck("Added Later")
+    manager.delete_match(manager.fetch_matches()[0]["id"])
+    assert manager.fetch_matches() == []
+
+    manager.import_snapshot(snapshot)
+
+    assert [deck["name"] for deck in manager.fetch_decks()] == ["Snapshot Deck"]
+    assert [match["match_no"] for match in manager.fetch_matches()] == [1]
+    assert manager.get_schema_version() == DatabaseManager.CURRENT_SCHEMA_VERSION
+
+
+def test_opponent_names_are_trimmed_once_by_v042_migration(temp_db: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+    manager.add_deck("Deck")
+
+    with manager.transaction() as connection:
+        deck_id = connection.execute(
+            "SELECT id FROM decks WHERE name = ?", ("Deck",)
+        ).fetchone()["id"]
+        connection.executemany(
+            "INSERT INTO opponent_decks (name, usage_count) VALUES (?, 0)",
+            [(" Rival ",), ("Rival",), ("  Legacy",), ("Unused",)],
+        )
+        connection.executemany(
+            """
+            INSERT INTO matches (match_no, deck_id, turn, opponent_deck, keywords, result)
+            VALUES (?, ?, 1, ?, '[]', 1)
+            """,
+            [
+                (1, deck_id, "Rival"),
+                (2, deck_id, "  Rival "),
+                (3, deck_id, "Legacy"),
+                (4, deck_id, None),
+            ],
+        )
+
+    manager.recalculate_usage_counts()
+
+    with manager.transaction() as connection:
+        stored = [
+            row["opponent_deck"]
+            for row in connection.execute("SELECT opponent_deck FROM matches ORDER BY id")
+        ]
+        counts = {
+            row["name"]: row["usage_count"]
+            for row in connection.execute("SELECT name, usage_count FROM opponent_decks")
+        }
+    assert stored == ["Rival", "  Rival ", "Legacy", None]
+    assert counts["  Legacy"] == 1
+
+    manager.set_schema_version("0.4.1")
+    manager.ensure_database()
+
+    with manager.transaction() as connection:
+        stored = [
+            row["opponent_deck"]
+            for row in connection.execute("SELECT opponent_deck FROM matches ORDER BY id")
+        ]
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM matches WHERE opponent_deck = ?",
+            ("Rival",),
+        ).fetchall()
+    assert stored == ["Rival", "Rival", "Legacy", None]
+    assert any("idx_matches_opponent_deck" in row[-1] for row in plan)
+    assert manager.get_schema_version() == "0.4.2"
+    assert {deck["name"]: deck["usage_count"] for deck in manager.fetch_opponent_decks()} == {
+        "Rival": 2,
+        "Legacy": 1,
+        "Unused": 0,
+    }
+
+
+def test_import_backup_trims_opponent_names_before_recount(
+    temp_db: Path, tmp_path: Path
+) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+    manager.add_deck("Deck")
+    manager.record_match(
+        {"match_no": 1, "deck_name": "Deck", "turn": True, "result": 1, "opponent_deck": "Foe"}
+    )
+    backup_dir = manager.export_backup(tmp_path / "backup")
+
+    matches_csv = backup_dir / "matches.csv"
+    with matches_csv.open(encoding="utf-8", newline="") as stream:
+        reader = csv.DictReader(stream)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+    rows[0]["opponent_deck"] = " Foe "
+    with matches_csv.open("w", encoding="utf-8", newline="") as stream:
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    manager.import_backup(backup_dir)
+
+    assert manager.fetch_matches()[0]["opponent_deck"] == "Foe"
+    assert manager.fetch_opponent_decks() == [{"name": "Foe", "usage_count": 1}]
+
+
+def test_set_schema_version_skips_write_when_unchanged(temp_db: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+
+    with sqlite3.connect(temp_db) as observer:
+        before = observer.execute("PRAGMA data_version").fetchone()[0]
+        manager.set_schema_version(manager.get_schema_version())
+        after = observer.execute("PRAGMA data_version").fetchone()[0]
+
+    assert after == before
+    assert manager.get_metadata("schema_version") == DatabaseManager.CURRENT_SCHEMA_VERSION
+
+
+def test_set_schema_version_repairs_stale_metadata_mirror(temp_db: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+    with manager.transaction() as connection:
+        connection.execute(
+            "UPDATE db_metadata SET value = ? WHERE key = 'schema_version'",
+            ("0.3.1",),
+        )
+
+    manager.set_schema_version(manager.get_schema_version())
+
+    assert manager.get_metadata("schema_version") == DatabaseManager.CURRENT_SCHEMA_VERSION
+    assert manager.get_schema_version() == DatabaseManager.CURRENT_SCHEMA_VERSION
+
+
+def test_add_season_returns_inserted_id(temp_db: Path) -> None:
+    manager = DatabaseManager(temp_db)
+    manager.ensure_database()
+
+    first_id = manager.add_season("beta")
+    second_id = manager.add_season("Alpha", "notes", start_date="2024-01-01")
+
+    seasons = {season["name"]: season for season in manager.fetch_seasons()}
+    assert seasons["beta"]["id"] == first_id
+    assert seasons["Alpha"]["id"] == second_id
+    assert seasons["Alpha"]["notes"] == "notes"
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.function import cmn_logger
+
+
+def test_log_error_writes_in_background_and_flushes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cmn_logger, "_LOG_DIR", tmp_path)
+
+    try:
+        raise ValueError("boom")
+    except ValueError as exc:
+        first = cmn_logger.log_error("First failure", exc, match_id=1)
+    second = cmn_logger.log_error("Second failure")
+    cmn_logger.flush_logs()
+
+    assert first == second
+    content = first.read_text(encoding="utf-8")
+    assert content.index("First failure") < content.index("Second failure")
+    assert "Context: match_id=1" in content
+    assert "ValueError: boom" in content
+    assert "No exception information available." in content
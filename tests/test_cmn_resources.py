@@ -0,0 +1,34 @@
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.function import cmn_resources
+
+
+def test_get_text_cache_is_invalidated_by_clear_text_cache(
+    tmp_path: Path, monkeypatch
+) -> None:
+    strings_path = tmp_path / "strings.json"
+    strings_path.write_text(json.dumps({"menu": {"title": "Before"}}), encoding="utf-8")
+    monkeypatch.setattr(cmn_resources, "_STRINGS_PATH", strings_path)
+    cmn_resources.clear_text_cache()
+
+    try:
+        assert cmn_resources.get_text("menu.title") == "Before"
+        assert cmn_resources.get_text("menu.missing") == "menu.missing"
+        assert cmn_resources.get_text("menu.missing", "fallback") == "fallback"
+
+        strings_path.write_text(
+            json.dumps({"menu": {"title": "After"}}), encoding="utf-8"
+        )
+        assert cmn_resources.get_text("menu.title") == "Before"
+
+        cmn_resources.clear_text_cache()
+        assert cmn_resources.get_text("menu.title") == "After"
+    finally:
+        monkeypatch.undo()
+        cmn_resources.clear_text_cache()
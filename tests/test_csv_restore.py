@@ -171,3 +171,24 @@ def test_restore_from_zip_bytes(tmp_path: Path) -> None:
     report = backup_restore.restore_from_zip_bytes(db_path, payload)
     assert report.ok
     assert report.restored["matches"] == 1
+
+
+def test_restore_accepts_result_aliases_written_by_the_app(tmp_path: Path) -> None:
+    db_path = tmp_path / "db.sqlite3"
+    manager = DatabaseManager(db_path)
+    manager.ensure_database()
+
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    _prepare_csv_backup(csv_dir)
+    matches_csv = csv_dir / "matches.csv"
+    matches_csv.write_text(
+        matches_csv.read_text(encoding="utf-8").replace(",win,", ",負け,"),
+        encoding="utf-8",
+    )
+
+    report = backup_restore.restore_from_directory(db_path, csv_dir)
+    assert report.ok
+    with sqlite3.connect(db_path) as connection:
+        result = connection.execute("SELECT result FROM matches").fetchone()[0]
+    assert result == -1